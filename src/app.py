@@ -10,13 +10,36 @@ backtests, connect to MetaTrader 5 and generate reports.
 from __future__ import annotations
 
 import argparse
+import importlib
 import logging
-from typing import List, Optional
+from typing import Any, List, Optional
+
+import yaml
 
 from .config.schema import load_config
-from .execution.backtest_exec import BacktestEngine
-from .execution.mt5_exec import MT5Engine
-from .reporting.report import generate_backtest_report
+
+# The execution engines and reporting pull in pandas, matplotlib and
+# MetaTrader5.  They are imported inside `main()` once the mode is known
+# so that `--help` and argument errors return without loading them.
+_LAZY_ATTRS = {
+    'BacktestEngine': '.execution.backtest_exec',
+    'MT5Engine': '.execution.mt5_exec',
+    'generate_backtest_report': '.reporting.report',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily imported names on first attribute access.
+
+    Keeps ``from src.app import MT5Engine`` working for existing callers
+    without importing MetaTrader5 and friends at module import time.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
 
 
 def _setup_logging(verbose: bool) -> None:
@@ -39,18 +62,28 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     _setup_logging(args.verbose)
 
-    config = load_config(args.config)
+    # Every mode needs the full configuration, so it is parsed (and any
+    # error reported) before the heavy engine modules are imported.
+    try:
+        config = load_config(args.config)
+    except (OSError, ValueError, yaml.YAMLError) as exc:
+        parser.error(f"cannot load configuration {args.config!r}: {exc}")
     # Override mode from CLI if provided
     config.mode = args.mode
 
     if args.mode == 'backtest':
+        from .execution.backtest_exec import BacktestEngine
+        from .reporting.report import generate_backtest_report
+
         logging.info("Running backtest...")
         engine = BacktestEngine(config)
-        trades, equity_curve = engine.run()
-        generate_backtest_report(trades, equity_curve, out_dir='results')
+        trade_log = engine.run_log()
+        generate_backtest_report(trade_log, out_dir='results')
         logging.info("Backtest complete. Results saved to the 'results' directory.")
     else:
         # Paper or live trading via MT5
+        from .execution.mt5_exec import MT5Engine
+
         live_flag = args.mode == 'live'
         logging.info("Starting %s trading via MetaTrader 5...", 'live' if live_flag else 'paper')
         engine = MT5Engine(config, live=live_flag)
@@ -8,17 +8,24 @@ of `Config` populated with reasonable defaults for any missing
 fields.
 
 Using dataclasses provides type hints and a clear contract for what
-values are expected.  When extending the configuration, add new
-fields to the appropriate dataclass and update `load_config()`
-accordingly.
+values are expected.  Section values are converted to the annotated
+field types and unknown keys are rejected, so misconfiguration fails
+at load time.  When extending the configuration, add new fields to the
+appropriate dataclass and to `_DEFAULTS`, and update `load_config()`
+for new top-level fields.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from datetime import time
 from typing import List, Optional, Dict, Any
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; the
+# pure-Python SafeLoader is several times slower on the same input.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class SessionConfig:
@@ -141,19 +148,161 @@ class Config:
     data: DataConfig = field(default_factory=DataConfig)
 
 
-def _merge_dict(defaults: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively merge two dictionaries.
-
-    The values in `override` take precedence over those in `defaults`.
-    This helper is used when loading YAML into nested dataclasses.
+# Nested dictionaries representing the default dataclasses.  Built once at
+# import time; `load_config()` overlays the YAML values section by section.
+_DEFAULTS: Dict[str, Any] = {
+    'symbols': ["EURUSD"],
+    'timeframe': "H1",
+    'session': {
+        'start': "06:00",
+        'end': "20:00",
+    },
+    'sl_pct': 0.005,
+    'tp_pct': 0.005,
+    'equity_pct_per_trade': 0.02,
+    'costs': {
+        'spread': 0.0,
+        'slippage': 0.0,
+        'commission_per_lot': 0.0,
+    },
+    'mt5': {
+        'login': 0,
+        'password': "",
+        'server': "",
+        'path': "",
+    },
+    'mode': 'backtest',
+    'data': {
+        'csv_dir': 'data',
+        'timezone': 'Europe/Brussels',
+    },
+}
+
+
+def _to_int(value: Any) -> int:
+    """Convert `value` to `int`, rejecting values with a fractional part."""
+    if isinstance(value, bool):
+        raise TypeError("booleans are not integers")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    number = float(value)
+    if not number.is_integer():
+        raise ValueError(f"{value!r} is not an integer")
+    return int(number)
+
+
+def _to_str(value: Any) -> str:
+    """Convert a scalar `value` to `str`, rejecting lists, mappings and booleans."""
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"{value!r} is not a string")
+    return str(value)
+
+
+def _to_float(value: Any) -> float:
+    """Convert `value` to `float`, rejecting booleans."""
+    if isinstance(value, bool):
+        raise TypeError("booleans are not numbers")
+    return float(value)
+
+
+# Converters for the field annotations of the configuration dataclasses
+_COERCE: Dict[str, Any] = {'str': _to_str, 'int': _to_int, 'float': _to_float}
+
+
+def _coerce(key: str, annotation: str, value: Any, default: Any) -> Any:
+    """Convert `value` of configuration key `key` to its annotated type.
+
+    Blank YAML values (``key:``) load as ``None`` and keep `default`.
+
+    Raises
+    ------
+    ValueError
+        If the value cannot be converted, naming `key`.
+    TypeError
+        If `annotation` has no converter in `_COERCE`; this is a schema
+        bug rather than a config error.
     """
-    result: Dict[str, Any] = defaults.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_dict(result[key], value)
-        else:
-            result[key] = value
-    return result
+    convert = _COERCE.get(annotation)
+    if convert is None:
+        raise TypeError(f"Unsupported annotation {annotation!r} for '{key}'; add a converter to _COERCE")
+    if value is None:
+        value = default
+    try:
+        return convert(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid value for '{key}' in the configuration: {value!r}") from exc
+
+
+def _section(raw: Dict[str, Any], name: str, cls: type) -> Any:
+    """Build the dataclass `cls` for section `name` of the configuration.
+
+    The YAML values are overlaid on the defaults and converted to the
+    annotated field types, so that e.g. ``spread: 1`` yields a float.
+    Keys left blank in the YAML fall back to their defaults.
+
+    Raises
+    ------
+    ValueError
+        If the section is not a mapping, contains unknown keys or holds
+        values that cannot be converted to the expected type (including
+        non‑integral values for integer fields).
+    TypeError
+        If a field is annotated with a type that has no converter in
+        `_COERCE`; this is a schema bug rather than a config error.
+    """
+    section = raw.get(name)
+    if section is None:
+        section = {}
+    elif not isinstance(section, dict):
+        raise ValueError(
+            f"The '{name}' section of the configuration must be a mapping, got {section!r}"
+        )
+    values = {**_DEFAULTS[name], **section}
+    known = {f.name: f.type for f in fields(cls)}
+    unknown = sorted(set(values) - set(known))
+    if unknown:
+        raise ValueError(f"Unknown keys in '{name}' section of the configuration: {unknown}")
+    kwargs = {
+        key: _coerce(f"{name}.{key}", known[key], value, _DEFAULTS[name][key])
+        for key, value in values.items()
+    }
+    return cls(**kwargs)
+
+
+def _scalar(raw: Dict[str, Any], key: str) -> Any:
+    """Return top‑level value `key` converted like a section value."""
+    annotation = next(f.type for f in fields(Config) if f.name == key)
+    return _coerce(key, annotation, raw.get(key), _DEFAULTS[key])
+
+
+def _check_session(session: SessionConfig) -> SessionConfig:
+    """Check that the session bounds are ``HH:MM`` times of day."""
+    for key in ('start', 'end'):
+        value = getattr(session, key)
+        # Same parsing as `utils.timeutils.parse_time_str`, which would
+        # pull in pandas here
+        try:
+            hour, minute = map(int, value.split(":"))
+            time(hour=hour, minute=minute)
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid value for 'session.{key}' in the configuration: {value!r} "
+                f"(expected a quoted \"HH:MM\" time)"
+            ) from exc
+    return session
+
+
+def _symbols(raw: Dict[str, Any]) -> List[str]:
+    """Return the configured symbols, which must be a non‑empty list."""
+    symbols = raw.get('symbols', _DEFAULTS['symbols'])
+    if not isinstance(symbols, list) or not symbols:
+        raise ValueError(f"'symbols' must be a non-empty list of symbol names, got {symbols!r}")
+    return [str(symbol) for symbol in symbols]
 
 
 def load_config(path: str) -> Config:
@@ -169,57 +318,33 @@ def load_config(path: str) -> Config:
     Config
         A populated configuration object.  Missing fields are filled with
         sensible defaults defined in the dataclasses.
+
+    Raises
+    ------
+    ValueError
+        If the file does not hold a mapping, a section is not a mapping,
+        `symbols` is not a non‑empty list, a value is invalid or a
+        session bound is not an ``HH:MM`` time.
     """
     with open(path, "r", encoding="utf-8") as fh:
-        raw: Dict[str, Any] = yaml.safe_load(fh) or {}
-
-    # Build nested dictionaries representing the default dataclasses
-    defaults: Dict[str, Any] = {
-        'symbols': ["EURUSD"],
-        'timeframe': "H1",
-        'session': {
-            'start': "06:00",
-            'end': "20:00",
-        },
-        'sl_pct': 0.005,
-        'tp_pct': 0.005,
-        'equity_pct_per_trade': 0.02,
-        'costs': {
-            'spread': 0.0,
-            'slippage': 0.0,
-            'commission_per_lot': 0.0,
-        },
-        'mt5': {
-            'login': 0,
-            'password': "",
-            'server': "",
-            'path': "",
-        },
-        'mode': 'backtest',
-        'data': {
-            'csv_dir': 'data',
-            'timezone': 'Europe/Brussels',
-        },
-    }
-
-    merged = _merge_dict(defaults, raw)
-
-    # Construct dataclasses from the merged dictionary
-    session_cfg = SessionConfig(**merged['session'])
-    costs_cfg = CostsConfig(**merged['costs'])
-    mt5_cfg = MT5Config(**merged['mt5'])
-    data_cfg = DataConfig(**merged['data'])
-
+        raw: Dict[str, Any] = yaml.load(fh, Loader=_YamlLoader) or {}
+    if not isinstance(raw, dict):
+        raise ValueError(
+            f"The configuration file must contain a mapping at the top level, "
+            f"got {type(raw).__name__}"
+        )
+
+    # The schema is only two levels deep, so each section is a flat overlay
     cfg = Config(
-        symbols=list(merged.get('symbols', [])),
-        timeframe=str(merged.get('timeframe', 'H1')),
-        session=session_cfg,
-        sl_pct=float(merged.get('sl_pct', 0.005)),
-        tp_pct=float(merged.get('tp_pct', 0.005)),
-        equity_pct_per_trade=float(merged.get('equity_pct_per_trade', 0.02)),
-        costs=costs_cfg,
-        mt5=mt5_cfg,
-        mode=str(merged.get('mode', 'backtest')).lower(),
-        data=data_cfg,
+        symbols=_symbols(raw),
+        timeframe=_scalar(raw, 'timeframe'),
+        session=_check_session(_section(raw, 'session', SessionConfig)),
+        sl_pct=_scalar(raw, 'sl_pct'),
+        tp_pct=_scalar(raw, 'tp_pct'),
+        equity_pct_per_trade=_scalar(raw, 'equity_pct_per_trade'),
+        costs=_section(raw, 'costs', CostsConfig),
+        mt5=_section(raw, 'mt5', MT5Config),
+        mode=_scalar(raw, 'mode').lower(),
+        data=_section(raw, 'data', DataConfig),
     )
-    return cfg
\ No newline at end of file
+    return cfg
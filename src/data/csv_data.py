@@ -11,16 +11,58 @@ time,open,high,low,close,tick_volume,spread
 Only the `time`, `open`, `high`, `low` and `close` columns are
 required.  Additional columns are ignored.  The `time` column
 should contain ISO‑formatted timestamps or UNIX epochs.  Timestamps
-will be converted to the timezone specified in the configuration.
+will be converted to the timezone specified in the configuration;
+ISO strings without a UTC offset are taken to be in that timezone.
+
+Parsed frames are cached as Parquet files under ``{csv_dir}/.cache``
+when `pyarrow` is installed.  Each cache entry records the size and
+modification time (in nanoseconds) of the CSV it was built from and is
+only reused while both still match exactly, so editing or replacing a
+CSV invalidates it, even with a file that carries an older timestamp.
 """
 
 from __future__ import annotations
 
+import logging
+import os
+import tempfile
 from pathlib import Path
+from typing import Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 from ..utils.timeutils import to_timezone
 
+# Attempt to import pyarrow for the Parquet cache.  If unavailable, every
+# load parses the CSV.
+try:
+    import pyarrow  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pyarrow = None
+    pq = None
+
+
+logger = logging.getLogger(__name__)
+
+# Price columns kept from the CSV and the dtype they are parsed as
+_PRICE_COLUMNS = ["open", "high", "low", "close"]
+_PRICE_DTYPES = {col: "float32" for col in _PRICE_COLUMNS}
+
+# Parquet schema metadata key holding the stamp of the cached CSV
+_SOURCE_KEY = b"csv_source"
+
+
+def _source_stamp(file_path: Path) -> bytes:
+    """Identify the current version of `file_path` by size and mtime."""
+    st = file_path.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}".encode("ascii")
+
+
+def _is_mt5_header(header: bytes) -> bool:
+    """Return `True` if the first line of a file looks like a MT5 export."""
+    return b"<DATE>" in header or header.count(b"\t") > header.count(b",")
+
 
 class CSVDataLoader:
     """Load OHLCV data from CSV files for backtesting.
@@ -37,62 +79,171 @@ class CSVDataLoader:
     def __init__(self, csv_dir: str, timezone: str) -> None:
         self.csv_dir = Path(csv_dir)
         self.timezone = timezone
+        self.cache_dir = self.csv_dir / ".cache"
+        # Contiguous float32 open/high/low/close arrays of each loaded symbol
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def _read_cache(self, stamp: bytes, cache_path: Path) -> Optional[pd.DataFrame]:
+        """Return the cached frame if it was built from the CSV `stamp`."""
+        if pyarrow is None or not cache_path.exists():
+            return None
+        try:
+            # Only the footer is read to validate the entry
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if metadata.get(_SOURCE_KEY) != stamp:
+                return None
+            df = pd.read_parquet(cache_path)
+        except Exception as exc:
+            logger.warning("Ignoring unreadable CSV cache %s: %s", cache_path, exc)
+            return None
+        # MT5 exports are localised in the configured timezone, so a cache
+        # written under another timezone cannot simply be converted.
+        if str(df.index.tz) != self.timezone:
+            return None
+        return df
+
+    def _write_cache(self, df: pd.DataFrame, stamp: bytes, cache_path: Path) -> None:
+        """Store a frame parsed from the CSV `stamp` for later runs."""
+        if pyarrow is None:
+            return
+        tmp_path: Optional[str] = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            table = pyarrow.Table.from_pandas(df)
+            metadata = {**(table.schema.metadata or {}), _SOURCE_KEY: stamp}
+            # A private temp file per writer: concurrent runs sharing the
+            # directory (or one symbol loaded twice) never publish each
+            # other's partially written file
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as fh:
+                pq.write_table(table.replace_schema_metadata(metadata), fh, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        except Exception as exc:
+            logger.warning("Could not write CSV cache %s: %s", cache_path, exc)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
     def load(self, symbol: str) -> pd.DataFrame:
-    file_path = self.csv_dir / f"{symbol}.csv"
-    if not file_path.exists():
-        raise FileNotFoundError(f"CSV file not found for symbol {symbol}: {file_path}")
-
-    # 1) Try "standard" CSV first: comma-separated with a single 'time' column
-    try:
-        df_std = pd.read_csv(file_path)
-        if "time" in df_std.columns:
-            df_std["time"] = pd.to_datetime(df_std["time"], errors="raise")
-            df_std = df_std.set_index("time").sort_index()
-            if df_std.index.tz is None:
-                df_std.index = df_std.index.tz_localize(self.timezone)
-            else:
-                df_std.index = df_std.index.tz_convert(self.timezone)
-            return df_std
-    except Exception:
-        pass  # fall back to MT5 format
-
-    # 2) MT5 export format: tab-separated with <DATE> and <TIME>
-    df = pd.read_csv(file_path, sep="\t", engine="python")
-    df.columns = [c.strip() for c in df.columns]
-
-    required = ["<DATE>", "<TIME>", "<OPEN>", "<HIGH>", "<LOW>", "<CLOSE>"]
-    missing = [c for c in required if c not in df.columns]
-    if missing:
-        raise ValueError(
-            f"Unrecognized CSV format for {symbol}. Missing columns: {missing}. "
-            f"Found columns: {list(df.columns)}"
+        """Load the OHLC bars for `symbol`.
+
+        Both the standard comma-separated layout described in the module
+        docstring and MetaTrader 5 tab-separated exports (``<DATE>``,
+        ``<TIME>``, ``<OPEN>`` ...) are accepted.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Columns ``open``, ``high``, ``low``, ``close`` as ``float32``,
+            indexed by timezone-aware timestamps sorted ascending.
+        """
+        file_path = self.csv_dir / f"{symbol}.csv"
+        if not file_path.exists():
+            raise FileNotFoundError(f"CSV file not found for symbol {symbol}: {file_path}")
+
+        cache_path = self.cache_dir / f"{symbol}.parquet"
+        # Stamp before parsing so that a CSV changing meanwhile is re-read
+        stamp = _source_stamp(file_path)
+        df = self._read_cache(stamp, cache_path)
+        if df is None:
+            df = self._parse(symbol, file_path)
+            self._write_cache(df, stamp, cache_path)
+        self._arrays[symbol] = tuple(
+            np.ascontiguousarray(df[col].to_numpy(dtype=np.float32)) for col in _PRICE_COLUMNS
         )
-
-    dt = df["<DATE>"].astype(str).str.strip() + " " + df["<TIME>"].astype(str).str.strip()
-    ts = pd.to_datetime(dt, format="%Y.%m.%d %H:%M:%S", errors="coerce")
-    if ts.isna().any():
-        # fallback if format differs
-        ts = pd.to_datetime(dt, errors="coerce")
-    if ts.isna().any():
-        bad = dt[ts.isna()].head(5).tolist()
-        raise ValueError(f"Could not parse MT5 DATE/TIME for {symbol}. Examples: {bad}")
-
-    out = pd.DataFrame(
-        {
-            "open": df["<OPEN>"].astype(float),
-            "high": df["<HIGH>"].astype(float),
-            "low": df["<LOW>"].astype(float),
-            "close": df["<CLOSE>"].astype(float),
-            # optional extras if you want them later:
-            # "tick_volume": df.get("<TICKVOL>", pd.Series([None]*len(df))).astype(float),
-            # "spread": df.get("<SPREAD>", pd.Series([None]*len(df))).astype(float),
-        },
-        index=pd.DatetimeIndex(ts),
-    ).sort_index()
-
-    # Important: MT5 export timestamps are usually "terminal/broker local time".
-    # For now we assume this matches Europe/Brussels, which fits your strategy definition.
-    out.index = out.index.tz_localize(self.timezone)
-
-    return out
\ No newline at end of file
+        return df
+
+    def price_arrays(self, symbol: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return the open, high, low and close prices of `symbol`.
+
+        The arrays are C‑contiguous ``float32`` and aligned with the
+        index of the frame returned by `load()`, which is called first
+        if the symbol has not been loaded yet.
+        """
+        if symbol not in self._arrays:
+            self.load(symbol)
+        return self._arrays[symbol]
+
+    def _parse(self, symbol: str, file_path: Path) -> pd.DataFrame:
+        """Parse `file_path`, dispatching on the layout named by its header."""
+        # Peek at the header so each file is read exactly once
+        with open(file_path, "rb") as fh:
+            header = fh.readline()
+        if _is_mt5_header(header):
+            return self._parse_mt5(symbol, file_path)
+        return self._parse_standard(symbol, file_path, header)
+
+    def _parse_standard(self, symbol: str, file_path: Path, header: bytes) -> pd.DataFrame:
+        """Parse the comma-separated layout with a single 'time' column."""
+        columns = [c.strip().strip('"') for c in header.decode("utf-8-sig", errors="replace").split(",")]
+        missing = [c for c in ["time", *_PRICE_COLUMNS] if c not in columns]
+        if missing:
+            raise ValueError(
+                f"Unrecognized CSV format for {symbol}. Missing columns: {missing}. "
+                f"Found columns: {columns}"
+            )
+        df = pd.read_csv(
+            file_path,
+            engine="c",
+            usecols=["time", *_PRICE_COLUMNS],
+            dtype=_PRICE_DTYPES,
+        )
+        if pd.api.types.is_numeric_dtype(df["time"]):
+            times = pd.to_datetime(df["time"], unit="s", utc=True)
+        elif len(df) and pd.Timestamp(df["time"].iloc[0]).tzinfo is not None:
+            # The offsets vary across DST changes, so go through UTC
+            times = pd.to_datetime(df["time"], format="ISO8601", utc=True, cache=True)
+        else:
+            times = pd.to_datetime(df["time"], format="ISO8601", cache=True)
+        df = df.drop(columns="time").set_index(pd.DatetimeIndex(times)).sort_index()
+        df.index.name = "time"
+        if df.index.tz is None:
+            df.index = df.index.tz_localize(self.timezone)
+        else:
+            df.index = df.index.tz_convert(self.timezone)
+        return df
+
+    def _parse_mt5(self, symbol: str, file_path: Path) -> pd.DataFrame:
+        """Parse a MT5 export: tab-separated with <DATE> and <TIME> columns."""
+        df = pd.read_csv(file_path, sep="\t", engine="c")
+        df.columns = [c.strip() for c in df.columns]
+
+        required = ["<DATE>", "<TIME>", "<OPEN>", "<HIGH>", "<LOW>", "<CLOSE>"]
+        missing = [c for c in required if c not in df.columns]
+        if missing:
+            raise ValueError(
+                f"Unrecognized CSV format for {symbol}. Missing columns: {missing}. "
+                f"Found columns: {list(df.columns)}"
+            )
+
+        dt = df["<DATE>"].astype(str).str.strip() + " " + df["<TIME>"].astype(str).str.strip()
+        ts = pd.to_datetime(dt, format="%Y.%m.%d %H:%M:%S", errors="coerce", cache=True)
+        if ts.isna().any():
+            # fallback if format differs
+            ts = pd.to_datetime(dt, errors="coerce")
+        if ts.isna().any():
+            bad = dt[ts.isna()].head(5).tolist()
+            raise ValueError(f"Could not parse MT5 DATE/TIME for {symbol}. Examples: {bad}")
+
+        out = pd.DataFrame(
+            {
+                "open": df["<OPEN>"].to_numpy(dtype="float32"),
+                "high": df["<HIGH>"].to_numpy(dtype="float32"),
+                "low": df["<LOW>"].to_numpy(dtype="float32"),
+                "close": df["<CLOSE>"].to_numpy(dtype="float32"),
+                # optional extras if you want them later:
+                # "tick_volume": df.get("<TICKVOL>", pd.Series([None]*len(df))).astype(float),
+                # "spread": df.get("<SPREAD>", pd.Series([None]*len(df))).astype(float),
+            },
+            index=pd.DatetimeIndex(ts),
+        ).sort_index()
+
+        # Important: MT5 export timestamps are usually "terminal/broker local time".
+        # For now we assume this matches Europe/Brussels, which fits your strategy definition.
+        out.index = out.index.tz_localize(self.timezone)
+
+        return out
@@ -95,6 +95,27 @@ class MT5DataFeed:
         utc_from = start
         utc_to = end
         rates = mt5.copy_rates_range(symbol, tf, utc_from, utc_to)
+        return self._rates_to_frame(rates)
+
+    def get_latest_rates(self, symbol: str, n: int = 3) -> pd.DataFrame:
+        """Retrieve the `n` most recent bars, including the one still forming.
+
+        Much cheaper than `get_rates` for polling since only a handful
+        of bars cross the terminal connection.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Same layout as `get_rates`.
+        """
+        if not self._connected:
+            raise RuntimeError("MT5DataFeed is not connected.  Call connect() before requesting data.")
+        tf = self._get_mt5_timeframe()
+        rates = mt5.copy_rates_from_pos(symbol, tf, 0, n)
+        return self._rates_to_frame(rates)
+
+    def _rates_to_frame(self, rates) -> pd.DataFrame:
+        """Convert a MT5 rates array to an OHLC frame in the configured timezone."""
         if rates is None or len(rates) == 0:
             return pd.DataFrame()
         df = pd.DataFrame(rates)
@@ -103,4 +124,4 @@ class MT5DataFeed:
         df = df.set_index('time').sort_index()
         # Convert to configured timezone
         df.index = df.index.tz_convert(self.timezone)
-        return df[['open', 'high', 'low', 'close']]
\ No newline at end of file
+        return df[['open', 'high', 'low', 'close']]
@@ -10,39 +10,372 @@ processes each symbol independently and aggregates the results.
 
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from ..config.schema import Config
 from ..data.csv_data import CSVDataLoader
-from ..strategy.intraday_breakout import IntradayBreakoutStrategy, IntradayState
-from ..execution.models import Position, Trade
+from ..strategy.intraday_breakout import IntradayBreakoutStrategy, breakout_step
+from ..execution.models import REASON_SL, REASON_TP, Trade, TradeLog
+from ..utils.jit import NUMBA_AVAILABLE, njit
 
 
 @dataclass
 class EquityPoint:
     """Represents the account equity at a given timestamp."""
+    __slots__ = ('timestamp', 'equity')
     timestamp: pd.Timestamp
     equity: float
 
 
+@njit(cache=True, nogil=True)
+def _f32_at_most(x: float) -> np.float32:
+    """Return the largest ``float32`` that is not greater than `x`."""
+    f = np.float32(x)
+    if f > x:
+        f = np.nextafter(f, np.float32(-np.inf))
+    return f
+
+
+@njit(cache=True, nogil=True)
+def _f32_at_least(x: float) -> np.float32:
+    """Return the smallest ``float32`` that is not less than `x`."""
+    f = np.float32(x)
+    if f < x:
+        f = np.nextafter(f, np.float32(np.inf))
+    return f
+
+
+@njit(cache=True, nogil=True)
+def _find_exit(
+    lows: np.ndarray,
+    highs: np.ndarray,
+    start: int,
+    stop: int,
+    is_long: bool,
+    sl_price: float,
+    tp_price: float,
+) -> int:
+    """Return the index of the first bar in ``[start, stop)`` hitting SL or TP.
+
+    The bars are scanned in vectorised chunks of growing size so that a
+    short-lived position does not pay for comparing the whole remaining
+    history.  Returns ``-1`` if neither level is reached.
+
+    The price arrays are ``float32``.  The levels are rounded outwards to
+    ``float32`` so that the comparisons stay in single precision while
+    giving exactly the same result as comparing against the ``float64``
+    levels.
+    """
+    if is_long:
+        low_level = _f32_at_most(sl_price)
+        high_level = _f32_at_least(tp_price)
+    else:
+        low_level = _f32_at_most(tp_price)
+        high_level = _f32_at_least(sl_price)
+    chunk = 64
+    while start < stop:
+        end = min(start + chunk, stop)
+        hit = (lows[start:end] <= low_level) | (highs[start:end] >= high_level)
+        if hit.any():
+            return start + int(np.argmax(hit))
+        start = end
+        chunk *= 2
+    return -1
+
+
+@njit(cache=True, nogil=True)
+def _simulate(
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    days: np.ndarray,
+    in_session: np.ndarray,
+    sl_pct: float,
+    tp_pct: float,
+    half_spread: float,
+    slippage: float,
+    commission_per_lot: float,
+    equity0: float,
+    alloc: float,
+):
+    """Simulate the trades of a single symbol.
+
+    While flat, each bar is evaluated with `breakout_step`; ``days`` and
+    ``in_session`` come from `IntradayBreakoutStrategy.bar_calendar`.  A
+    signal on bar ``i`` fills at the open of bar ``i + 1``; the position
+    is then closed on the first bar touching its stop‑loss or
+    take‑profit, and that exit bar is evaluated for a new entry.  Bars
+    during which a position is open are not evaluated, so the intraday
+    levels stay frozen until the position is closed, as in the live
+    engine.  Only one position is open at a time.  The last bar only
+    serves as the fill for a signal on the bar before it.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(entry_idx, exit_idx, side, volume, entry_price, exit_price,
+        pnl, fees, reason, equity)`` with one element per completed
+        trade.  ``equity`` is the account equity after each trade.
+    """
+    last = opens.shape[0] - 1
+    # Every trade consumes a distinct signal bar, which bounds the output
+    # size; pages of the unused tail are never touched
+    cap = max(last, 0)
+    entry_idx = np.empty(cap, dtype=np.int64)
+    exit_idx = np.empty(cap, dtype=np.int64)
+    side = np.empty(cap, dtype=np.int8)
+    volume = np.empty(cap, dtype=np.float64)
+    entry_price = np.empty(cap, dtype=np.float64)
+    exit_price = np.empty(cap, dtype=np.float64)
+    pnl = np.empty(cap, dtype=np.float64)
+    fees = np.empty(cap, dtype=np.float64)
+    reason = np.empty(cap, dtype=np.int8)
+    equity_after = np.empty(cap, dtype=np.float64)
+
+    # Level multipliers are loop invariants
+    long_sl = 1.0 - sl_pct
+    long_tp = 1.0 + tp_pct
+    short_sl = 1.0 + sl_pct
+    short_tp = 1.0 - tp_pct
+
+    equity = equity0
+    cur_high = 0.0
+    cur_low = 0.0
+    # Local day of the last evaluated bar; the first bar always starts a day
+    cur_day = days[0] - 1 if last > 0 else 0
+    k = 0
+    i = 0
+    while i < last:
+        # Evaluate the bar for an entry; we are flat here
+        signal, cur_high, cur_low = breakout_step(
+            float(highs[i]), float(lows[i]), days[i] != cur_day, cur_high, cur_low
+        )
+        cur_day = days[i]
+        if signal == 0 or not in_session[i]:
+            i += 1
+            continue
+
+        is_long = signal > 0
+        # +1 for long, -1 for short: costs always move the fill against us
+        direction = 1.0 if is_long else -1.0
+        # Enter at next bar open with spread and slippage
+        open_price = float(opens[i + 1])
+        entry = open_price + direction * half_spread + direction * slippage
+        sl_price = entry * (long_sl if is_long else short_sl)
+        tp_price = entry * (long_tp if is_long else short_tp)
+        # Volume in units (approximate one unit per quote currency)
+        vol = (equity * alloc) / open_price
+
+        j = _find_exit(lows, highs, i + 1, last, is_long, sl_price, tp_price)
+        if j < 0:
+            # Position is still open at the end of the data
+            break
+
+        # Stop-loss takes precedence when both levels are touched on one bar
+        hit_sl = (lows[j] <= sl_price) if is_long else (highs[j] >= sl_price)
+        base = sl_price if hit_sl else tp_price
+        # Close at bid (long) or ask (short) including slippage
+        exit_px = base - direction * half_spread - direction * slippage
+        trade_pnl = direction * (exit_px - entry) * vol
+        trade_fees = commission_per_lot * vol
+        equity += trade_pnl - trade_fees
+
+        entry_idx[k] = i + 1
+        exit_idx[k] = j
+        side[k] = signal
+        volume[k] = vol
+        entry_price[k] = entry
+        exit_price[k] = exit_px
+        pnl[k] = trade_pnl
+        fees[k] = trade_fees
+        reason[k] = REASON_SL if hit_sl else REASON_TP
+        equity_after[k] = equity
+        k += 1
+        # Flat again: the exit bar is evaluated next
+        i = j
+
+    return (
+        entry_idx[:k],
+        exit_idx[:k],
+        side[:k],
+        volume[:k],
+        entry_price[:k],
+        exit_price[:k],
+        pnl[:k],
+        fees[:k],
+        reason[:k],
+        equity_after[:k],
+    )
+
+
+# Column order of the trade frame; matches the fields of `Trade`
+TRADE_COLUMNS = [
+    'symbol',
+    'side',
+    'volume',
+    'entry_price',
+    'exit_price',
+    'entry_time',
+    'exit_time',
+    'pnl',
+    'fees',
+    'reason',
+]
+
+
+# Trade log columns that are proportional to the starting equity
+_EQUITY_SCALED_COLUMNS = ['volume', 'pnl', 'fees', 'equity']
+
+
+def frame_to_trades(frame: pd.DataFrame) -> List[Trade]:
+    """Build `Trade` objects from a trade frame returned by `run_frame()`."""
+    return [Trade(*row) for row in frame[TRADE_COLUMNS].itertuples(index=False, name=None)]
+
+
+def frame_to_equity_curve(frame: pd.DataFrame) -> List[EquityPoint]:
+    """Build the equity curve from a trade frame returned by `run_frame()`."""
+    return [
+        EquityPoint(timestamp=ts, equity=eq)
+        for ts, eq in zip(frame['exit_time'], frame['equity'].tolist())
+    ]
+
+
 class BacktestEngine:
     """Run backtests on historical data loaded from CSV files."""
 
-    def __init__(self, config: Config, initial_equity: float = 100_000.0) -> None:
+    def __init__(
+        self,
+        config: Config,
+        initial_equity: float = 100_000.0,
+        max_workers: Optional[int] = None,
+    ) -> None:
         self.config = config
         self.initial_equity = initial_equity
+        # Number of symbols simulated in parallel; defaults to the CPU count
+        self.max_workers = max_workers
         self.data_loader = CSVDataLoader(config.data.csv_dir, config.data.timezone)
         self.strategy = IntradayBreakoutStrategy(config)
 
-    def _compute_fees(self, volume: float) -> float:
-        """Compute commission fees based on volume and configuration."""
-        return self.config.costs.commission_per_lot * volume
+    def _run_symbol(self, symbol: str) -> Optional[TradeLog]:
+        """Backtest a single symbol starting from `initial_equity`.
+
+        Returns the trade log of the symbol, or `None` if it produced no
+        trades.
+        """
+        # Load historical data for this symbol
+        df = self.data_loader.load(symbol)
+        # Need at least two bars to trade (current and next for entry)
+        if len(df) < 2:
+            return None
+        opens, highs, lows, _ = self.data_loader.price_arrays(symbol)
+        days, in_session = self.strategy.bar_calendar(df.index)
+        config = self.config
+        costs = config.costs
+        (
+            entry_idx,
+            exit_idx,
+            side,
+            volume,
+            entry_price,
+            exit_price,
+            pnl,
+            fees,
+            reason,
+            equity_after,
+        ) = _simulate(
+            opens,
+            highs,
+            lows,
+            days,
+            in_session,
+            config.sl_pct,
+            config.tp_pct,
+            costs.spread / 2,
+            costs.slippage,
+            costs.commission_per_lot,
+            self.initial_equity,
+            config.equity_pct_per_trade,
+        )
+        if len(equity_after) == 0:
+            return None
+        log = TradeLog(config.data.timezone, capacity=len(equity_after))
+        log.extend(
+            symbol=symbol,
+            side=side,
+            volume=volume,
+            entry_price=entry_price,
+            exit_price=exit_price,
+            entry_time=df.index[entry_idx],
+            exit_time=df.index[exit_idx],
+            pnl=pnl,
+            fees=fees,
+            reason=reason,
+            equity=equity_after,
+        )
+        return log
+
+    def run_log(self) -> TradeLog:
+        """Execute the backtest and return the trades column‑wise.
+
+        Symbols are simulated concurrently.  Each one starts from
+        `initial_equity`; since position sizes are a fixed fraction of
+        equity, every amount of a symbol scales linearly with its
+        starting equity, so the results are rescaled afterwards to chain
+        the symbols in configuration order.
+
+        Returns
+        -------
+        TradeLog
+            One row per completed trade, ordered by symbol and then by
+            exit time.  Its ``equity`` column is the equity curve.
+        """
+        symbols = list(self.config.symbols)
+        workers = min(len(symbols), self.max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            # Compiled kernels release the GIL, so threads are enough;
+            # otherwise the simulation needs separate processes.
+            executor_cls = ThreadPoolExecutor if NUMBA_AVAILABLE else ProcessPoolExecutor
+            with executor_cls(max_workers=workers) as executor:
+                results = list(executor.map(self._run_symbol, symbols))
+        else:
+            results = [self._run_symbol(symbol) for symbol in symbols]
+
+        equity = self.initial_equity
+        log = TradeLog(self.config.data.timezone, capacity=sum(len(r) for r in results if r is not None))
+        for symbol_log in results:
+            if symbol_log is None:
+                continue
+            if self.initial_equity and equity != self.initial_equity:
+                for name in _EQUITY_SCALED_COLUMNS:
+                    column = getattr(symbol_log, name)
+                    column *= equity / self.initial_equity
+            equity = float(symbol_log.equity[-1])
+            log.extend(**symbol_log.columns())
+        return log
+
+    def run_frame(self) -> pd.DataFrame:
+        """Execute the backtest and return the trades as a DataFrame.
+
+        Returns
+        -------
+        pandas.DataFrame
+            `run_log()` as a frame: one row per completed trade with the
+            columns in `TRADE_COLUMNS` plus `equity`, the account equity
+            after the trade.
+        """
+        return self.run_log().to_frame()
 
     def run(self) -> Tuple[List[Trade], List[EquityPoint]]:
         """Execute the backtest across all configured symbols.
 
+        This materialises the result of `run_log()` as dataclasses;
+        callers that only need columns should use `run_log()` directly.
+
         Returns
         -------
         trades : list of Trade
@@ -50,100 +383,5 @@ class BacktestEngine:
         equity_curve : list of EquityPoint
             Equity after each trade for plotting and metrics.
         """
-        equity = self.initial_equity
-        trades: List[Trade] = []
-        equity_curve: List[EquityPoint] = []
-
-        for symbol in self.config.symbols:
-            # Load historical data for this symbol
-            df = self.data_loader.load(symbol)
-            # Need at least two bars to trade (current and next for entry)
-            if len(df) < 2:
-                continue
-            # Initialise per‑symbol state
-            state = IntradayState()
-            position: Optional[Position] = None
-            # Iterate through bars except the last one (since we need next bar’s open for entry)
-            for idx in range(len(df) - 1):
-                ts = df.index[idx]
-                bar = df.iloc[idx]
-                next_ts = df.index[idx + 1]
-                next_bar = df.iloc[idx + 1]
-
-                # If we have an open position, check for exit conditions on the current bar
-                if position is not None:
-                    exit_signal: Optional[str] = None
-                    exit_base_price: float = 0.0
-                    if position.side == 'long':
-                        if bar['low'] <= position.sl_price:
-                            exit_signal = 'sl'
-                            exit_base_price = position.sl_price
-                        elif bar['high'] >= position.tp_price:
-                            exit_signal = 'tp'
-                            exit_base_price = position.tp_price
-                    elif position.side == 'short':
-                        if bar['high'] >= position.sl_price:
-                            exit_signal = 'sl'
-                            exit_base_price = position.sl_price
-                        elif bar['low'] <= position.tp_price:
-                            exit_signal = 'tp'
-                            exit_base_price = position.tp_price
-                    # If exit triggered, close at the base price adjusted for spread and slippage
-                    if exit_signal is not None:
-                        half_spread = self.config.costs.spread / 2
-                        slippage = self.config.costs.slippage
-                        if position.side == 'long':
-                            # Sell at bid: subtract half spread and slippage
-                            exit_price = exit_base_price - half_spread - slippage
-                            pnl = (exit_price - position.entry_price) * position.volume
-                        else:
-                            # Buy at ask: add half spread and slippage
-                            exit_price = exit_base_price + half_spread + slippage
-                            pnl = (position.entry_price - exit_price) * position.volume
-                        fees = self._compute_fees(position.volume)
-                        equity += pnl - fees
-                        trade = Trade(
-                            symbol=position.symbol,
-                            side=position.side,
-                            volume=position.volume,
-                            entry_price=position.entry_price,
-                            exit_price=exit_price,
-                            entry_time=position.entry_time,
-                            exit_time=ts,
-                            pnl=pnl,
-                            fees=fees,
-                            reason=exit_signal,
-                        )
-                        trades.append(trade)
-                        equity_curve.append(EquityPoint(timestamp=ts, equity=equity))
-                        position = None
-
-                # If no open position, evaluate for new entry
-                if position is None:
-                    signal, state = self.strategy.evaluate_bar(ts, bar, state)
-                    if signal:
-                        # Determine entry price at next bar open with spread and slippage
-                        open_price = next_bar['open']
-                        half_spread = self.config.costs.spread / 2
-                        slippage = self.config.costs.slippage
-                        if signal == 'long':
-                            entry_price = open_price + half_spread + slippage
-                            sl_price = entry_price * (1.0 - self.config.sl_pct)
-                            tp_price = entry_price * (1.0 + self.config.tp_pct)
-                        else:  # short
-                            entry_price = open_price - half_spread - slippage
-                            sl_price = entry_price * (1.0 + self.config.sl_pct)
-                            tp_price = entry_price * (1.0 - self.config.tp_pct)
-                        # Calculate volume in units (approximate one unit per quote currency)
-                        volume = (equity * self.config.equity_pct_per_trade) / open_price
-                        # Record new position
-                        position = Position(
-                            symbol=symbol,
-                            side=signal,
-                            volume=volume,
-                            entry_price=entry_price,
-                            sl_price=sl_price,
-                            tp_price=tp_price,
-                            entry_time=next_ts,
-                        )
-        return trades, equity_curve
\ No newline at end of file
+        frame = self.run_frame()
+        return frame_to_trades(frame), frame_to_equity_curve(frame)
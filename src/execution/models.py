@@ -3,18 +3,23 @@ Order, position and trade models.
 
 These dataclasses represent the objects passed between the strategy
 and execution engines.  Keeping them in a separate module improves
-readability and makes unit testing easier.
+readability and makes unit testing easier.  `TradeLog` holds many
+completed trades column‑wise for the backtest and its reports.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any, Dict, Optional
+import numpy as np
 import pandas as pd
 
 
 @dataclass
 class Position:
     """Represents an open position on a given symbol."""
+    # Slots instead of a per-instance __dict__ (dataclass(slots=True) needs 3.10+)
+    __slots__ = ('symbol', 'side', 'volume', 'entry_price', 'sl_price', 'tp_price', 'entry_time')
     symbol: str
     side: str  # 'long' or 'short'
     volume: float
@@ -27,6 +32,18 @@ class Position:
 @dataclass
 class Trade:
     """Represents a completed trade."""
+    __slots__ = (
+        'symbol',
+        'side',
+        'volume',
+        'entry_price',
+        'exit_price',
+        'entry_time',
+        'exit_time',
+        'pnl',
+        'fees',
+        'reason',
+    )
     symbol: str
     side: str
     volume: float
@@ -36,4 +53,144 @@ class Trade:
     exit_time: pd.Timestamp
     pnl: float
     fees: float
-    reason: str  # 'tp' or 'sl'
\ No newline at end of file
+    reason: str  # 'tp' or 'sl'
+
+
+# Codes stored in the `side` and `reason` columns of a `TradeLog`
+SIDE_LONG = 1
+SIDE_SHORT = -1
+REASON_SL = 0
+REASON_TP = 1
+
+
+def _utc_datetime64(values: Any) -> np.ndarray:
+    """Convert timestamps to naive UTC ``datetime64[ns]`` values.
+
+    Timezone‑aware inputs are converted to UTC; naive inputs are taken to
+    be UTC already.
+    """
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_convert('UTC').tz_localize(None)
+    return index.as_unit('ns').to_numpy()
+
+
+class TradeLog:
+    """Completed trades stored column‑wise.
+
+    Every field of `Trade`, plus ``equity`` (the account equity after
+    the trade), is kept in its own NumPy array, so metrics and reports
+    reduce whole columns instead of walking `Trade` objects.  Columns
+    are read as attributes (``log.pnl``, ``log.exit_time``, ...) and are
+    views of the filled part of the buffers.
+
+    ``side`` and ``reason`` hold the int8 codes `SIDE_LONG`/`SIDE_SHORT`
+    and `REASON_SL`/`REASON_TP`.  Timestamps are stored as naive UTC
+    ``datetime64[ns]``; `to_frame()` presents them in `tz`.
+
+    Parameters
+    ----------
+    tz : str, optional
+        IANA timezone of the trade timestamps, or `None` for naive ones.
+    capacity : int
+        Number of rows to allocate up front.  The buffers double when
+        full, so extending is amortised constant time per row.
+    """
+
+    # Column name -> dtype, in the field order of `Trade`
+    COLUMNS: Dict[str, Any] = {
+        'symbol': object,
+        'side': np.int8,
+        'volume': np.float64,
+        'entry_price': np.float64,
+        'exit_price': np.float64,
+        'entry_time': 'datetime64[ns]',
+        'exit_time': 'datetime64[ns]',
+        'pnl': np.float64,
+        'fees': np.float64,
+        'reason': np.int8,
+        'equity': np.float64,
+    }
+    _TIME_COLUMNS = ('entry_time', 'exit_time')
+
+    def __init__(self, tz: Optional[str] = 'UTC', capacity: int = 16) -> None:
+        self.tz = tz
+        self._size = 0
+        self._data = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in self.COLUMNS.items()
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Only reached for names that are not regular attributes
+        data = self.__dict__.get('_data')
+        if data is not None and name in data:
+            return data[name][: self._size]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _reserve(self, count: int) -> None:
+        """Make room for `count` more rows, doubling the buffers if needed."""
+        capacity = len(self._data['pnl'])
+        needed = self._size + count
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity, 16)
+        for name, column in self._data.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._data[name] = grown
+
+    def extend(self, **columns: Any) -> None:
+        """Append several trades given as one array per column.
+
+        Every column of `COLUMNS` must be passed; scalars are broadcast.
+        Timestamps may be timezone‑aware (e.g. a `pandas.DatetimeIndex`)
+        or naive UTC ``datetime64`` values.
+        """
+        if set(columns) != set(self.COLUMNS):
+            missing = sorted(set(self.COLUMNS) - set(columns))
+            unknown = sorted(set(columns) - set(self.COLUMNS))
+            raise ValueError(f"TradeLog.extend: missing columns {missing}, unknown columns {unknown}")
+        count = len(columns['pnl'])
+        self._reserve(count)
+        start, stop = self._size, self._size + count
+        for name, values in columns.items():
+            if name in self._TIME_COLUMNS:
+                values = _utc_datetime64(values)
+            self._data[name][start:stop] = values
+        self._size = stop
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Return the filled columns keyed by name (views, not copies)."""
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def times(self, name: str) -> pd.DatetimeIndex:
+        """Return a timestamp column as a `DatetimeIndex` in `tz`."""
+        index = pd.DatetimeIndex(getattr(self, name))
+        if self.tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.tz)
+        return index
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the trades as a DataFrame with the fields of `Trade`.
+
+        ``side`` and ``reason`` are decoded to their string values and
+        the timestamps are timezone‑aware in `tz`.
+        """
+        return pd.DataFrame(
+            {
+                'symbol': self.symbol,
+                'side': np.where(self.side > 0, 'long', 'short'),
+                'volume': self.volume,
+                'entry_price': self.entry_price,
+                'exit_price': self.exit_price,
+                'entry_time': self.times('entry_time'),
+                'exit_time': self.times('exit_time'),
+                'pnl': self.pnl,
+                'fees': self.fees,
+                'reason': np.where(self.reason == REASON_SL, 'sl', 'tp'),
+                'equity': self.equity,
+            }
+        )
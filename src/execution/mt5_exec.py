@@ -15,10 +15,11 @@ serves as a reference and starting point.
 
 from __future__ import annotations
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict
 import logging
-from datetime import datetime, timedelta
 import pandas as pd
 
 from ..config.schema import Config
@@ -30,6 +31,23 @@ from ..utils.persistence import load_state, save_state
 
 logger = logging.getLogger(__name__)
 
+# Bar length of each supported timeframe as a pandas frequency
+_TIMEFRAME_FREQ = {
+    'M1': '1min',
+    'M5': '5min',
+    'M15': '15min',
+    'M30': '30min',
+    'H1': '1h',
+    'H4': '4h',
+    'D1': '1D',
+}
+# Seconds to wait past a bar boundary before expecting the closed bar
+_BAR_CLOSE_DELAY_S = 2.0
+# While a closed bar has not shown up yet, poll this often ...
+_BAR_RETRY_S = 5.0
+# ... but only for this long after the boundary (e.g. markets are closed)
+_BAR_RETRY_WINDOW_S = 60.0
+
 
 class MT5Engine:
     """Run the trading strategy in paper or live mode via MetaTrader 5."""
@@ -41,25 +59,44 @@ class MT5Engine:
         self.data_feed = MT5DataFeed(config.mt5, config.data.timezone, config.timeframe)
         self.strategy = IntradayBreakoutStrategy(config)
         self.positions: Dict[str, Optional[Position]] = {sym: None for sym in config.symbols}
+        # Order pricing parameters, fixed for the lifetime of the engine
+        self._half_spread = config.costs.spread / 2
+        self._slippage = config.costs.slippage
+        self._sl_pct = config.sl_pct
+        self._tp_pct = config.tp_pct
         # Load previous state if it exists
         persisted = load_state(self.state_file)
         if persisted:
-            for sym, pos in persisted.get('positions', {}).items():
-                if pos is not None:
-                    # Recreate Position dataclass
-                    self.positions[sym] = Position(
-                        symbol=sym,
-                        side=pos['side'],
-                        volume=pos['volume'],
-                        entry_price=pos['entry_price'],
-                        sl_price=pos['sl_price'],
-                        tp_price=pos['tp_price'],
-                        entry_time=pd.Timestamp(pos['entry_time']),
-                    )
+            open_positions = [
+                (sym, pos) for sym, pos in persisted.get('positions', {}).items() if pos is not None
+            ]
+            # Parse all entry times in one vectorised call
+            entry_times = pd.to_datetime(
+                [pos['entry_time'] for _, pos in open_positions], utc=True, format='ISO8601'
+            ).tz_convert(config.data.timezone)
+            for (sym, pos), entry_time in zip(open_positions, entry_times):
+                # Recreate Position dataclass
+                self.positions[sym] = Position(
+                    symbol=sym,
+                    side=pos['side'],
+                    volume=pos['volume'],
+                    entry_price=pos['entry_price'],
+                    sl_price=pos['sl_price'],
+                    tp_price=pos['tp_price'],
+                    entry_time=entry_time,
+                )
         self.last_bar_times: Dict[str, Optional[pd.Timestamp]] = {sym: None for sym in config.symbols}
+        # Symbols are polled concurrently; the lock guards positions and the state file
+        self._pool = ThreadPoolExecutor(max_workers=max(1, min(len(config.symbols), 16)))
+        self._lock = threading.Lock()
+        # Set when positions changed during a poll cycle; flushed once per cycle
+        self._state_dirty = False
 
-    def _persist_state(self) -> None:
-        """Save positions and last processed times to disk."""
+    def _persist_state(self, pretty: bool = False) -> None:
+        """Save positions and last processed times to disk.
+
+        Set `pretty` for the human‑readable snapshot written on shutdown.
+        """
         positions_state: Dict[str, Optional[Dict[str, any]]] = {}
         for sym, pos in self.positions.items():
             if pos is None:
@@ -76,110 +113,174 @@ class MT5Engine:
         state = {
             'positions': positions_state,
         }
-        save_state(self.state_file, state)
+        save_state(self.state_file, state, pretty=pretty)
+
+    def _seconds_until_next_poll(self, now: Optional[pd.Timestamp] = None) -> float:
+        """Return how long after `now` the next poll is due.
+
+        Polls are aligned to the bar boundaries of the configured
+        timeframe, in the configured timezone.  Shortly after a boundary,
+        symbols whose freshly closed bar has not arrived yet are retried
+        every few seconds.  Unknown timeframes fall back to a minute.
+        `now` is a timezone‑aware timestamp and defaults to the current
+        time.
+        """
+        freq = _TIMEFRAME_FREQ.get(self.config.timeframe.upper())
+        if freq is None:
+            return 60.0
+        bar = pd.Timedelta(freq)
+        tz = self.config.data.timezone
+        if now is None:
+            now = pd.Timestamp.now(tz=tz)
+        # Work on local wall-clock time, where the broker's bars are aligned
+        now = now.tz_convert(tz).tz_localize(None)
+        bar_start = now.floor(freq)
+        last_closed = bar_start - bar
+        stale = any(
+            ts is None or ts.tz_convert(tz).tz_localize(None) < last_closed
+            for ts in self.last_bar_times.values()
+        )
+        if stale and (now - bar_start).total_seconds() < _BAR_RETRY_WINDOW_S:
+            return _BAR_RETRY_S
+        return (bar_start + bar - now).total_seconds() + _BAR_CLOSE_DELAY_S
+
+    def _process_symbol(self, symbol: str, states: Dict[str, IntradayState]) -> None:
+        """Handle the latest closed bar of one symbol.
+
+        Checks the open position for an exit or, if flat, evaluates the
+        strategy for a new entry.  Runs on the worker pool concurrently
+        for different symbols; `self.positions` is updated under
+        `self._lock` and the state is only marked dirty, to be written
+        once at the end of the poll cycle.
+        """
+        # Fetch only the most recent bars to have current and next bar
+        bars = self.data_feed.get_latest_rates(symbol, n=3)
+        if bars.empty or len(bars) < 2:
+            return
+        # Determine the most recent complete bar (second to last row)
+        ts = bars.index[-2]
+        if ts == self.last_bar_times[symbol]:
+            # This bar was already processed on an earlier poll
+            return
+        self.last_bar_times[symbol] = ts
+        bar = bars.iloc[-2]
+        next_ts = bars.index[-1]
+        # Get current position
+        position = self.positions.get(symbol)
+        state = states[symbol]
+        high = bar['high']
+        low = bar['low']
+        # If position open, check for exits
+        if position is not None:
+            exit_signal: Optional[str] = None
+            exit_base_price: float = 0.0
+            if position.side == 'long':
+                if low <= position.sl_price:
+                    exit_signal = 'sl'
+                    exit_base_price = position.sl_price
+                elif high >= position.tp_price:
+                    exit_signal = 'tp'
+                    exit_base_price = position.tp_price
+            else:
+                if high >= position.sl_price:
+                    exit_signal = 'sl'
+                    exit_base_price = position.sl_price
+                elif low <= position.tp_price:
+                    exit_signal = 'tp'
+                    exit_base_price = position.tp_price
+            if exit_signal is not None:
+                logger.info(
+                    "Closing %s position on %s at %s due to %s",
+                    position.side,
+                    symbol,
+                    exit_base_price,
+                    exit_signal,
+                )
+                # Remove open position
+                with self._lock:
+                    self.positions[symbol] = None
+                    self._state_dirty = True
+                return
+        # If no position, check for new signal
+        if position is None:
+            signal, new_state = self.strategy.evaluate_bar(ts, bar, state)
+            states[symbol] = new_state
+            if signal:
+                open_price = bars['open'].iloc[-1]
+                half_spread = self._half_spread
+                slip = self._slippage
+                if signal == 'long':
+                    entry_price = open_price + half_spread + slip
+                    sl_price = entry_price * (1.0 - self._sl_pct)
+                    tp_price = entry_price * (1.0 + self._tp_pct)
+                else:
+                    entry_price = open_price - half_spread - slip
+                    sl_price = entry_price * (1.0 + self._sl_pct)
+                    tp_price = entry_price * (1.0 - self._tp_pct)
+                volume = 0.0  # Determine appropriate volume using account equity via MT5 API
+                logger.info(
+                    "Placing %s order on %s at %s (SL=%s, TP=%s)",
+                    signal,
+                    symbol,
+                    entry_price,
+                    sl_price,
+                    tp_price,
+                )
+                # Record the position (actual order_send call omitted for safety)
+                with self._lock:
+                    self.positions[symbol] = Position(
+                        symbol=symbol,
+                        side=signal,
+                        volume=volume,
+                        entry_price=entry_price,
+                        sl_price=sl_price,
+                        tp_price=tp_price,
+                        entry_time=next_ts,
+                    )
+                    self._state_dirty = True
 
     def run(self) -> None:
         """Main loop for paper/live trading.
 
         Connects to MT5, polls for new bars and places orders when
-        signals occur.  This loop runs indefinitely.  Press Ctrl+C to
-        stop.  On termination, the current state is saved to disk.
+        signals occur.  Polls are scheduled right after each bar close
+        and the symbols are processed concurrently.  This loop runs
+        indefinitely.  Press Ctrl+C to stop.  On termination, the
+        current state is saved to disk.
         """
         logger.info("Starting MT5 engine (live=%s)", self.live)
         try:
             self.data_feed.connect()
         except Exception as exc:
-            logger.error("Failed to connect to MetaTrader 5: %s", exc)
+            logger.error("Failed to connect to MetaTrader 5: %s", exc)
             return
         # Initialise intraday states per symbol
         states: Dict[str, IntradayState] = {sym: IntradayState() for sym in self.config.symbols}
         try:
             while True:
-                for symbol in self.config.symbols:
-                    # Determine the time window to fetch bars
-                    now_utc = datetime.utcnow()
-                    # Fetch the last two bars to have current and next bar
-                    bars = self.data_feed.get_rates(symbol, now_utc - timedelta(days=2), now_utc)
-                    if bars.empty or len(bars) < 2:
-                        continue
-                    # Determine the most recent complete bar (second to last row)
-                    bar = bars.iloc[-2]
-                    ts = bars.index[-2]
-                    next_bar = bars.iloc[-1]
-                    next_ts = bars.index[-1]
-                    # Get current position
-                    position = self.positions.get(symbol)
-                    state = states[symbol]
-                    # If position open, check for exits
-                    if position is not None:
-                        exit_signal: Optional[str] = None
-                        exit_base_price: float = 0.0
-                        if position.side == 'long':
-                            if bar['low'] <= position.sl_price:
-                                exit_signal = 'sl'
-                                exit_base_price = position.sl_price
-                            elif bar['high'] >= position.tp_price:
-                                exit_signal = 'tp'
-                                exit_base_price = position.tp_price
-                        else:
-                            if bar['high'] >= position.sl_price:
-                                exit_signal = 'sl'
-                                exit_base_price = position.sl_price
-                            elif bar['low'] <= position.tp_price:
-                                exit_signal = 'tp'
-                                exit_base_price = position.tp_price
-                        if exit_signal is not None:
-                            logger.info(
-                                "Closing %s position on %s at %s due to %s",
-                                position.side,
-                                symbol,
-                                exit_base_price,
-                                exit_signal,
-                            )
-                            # Remove open position
-                            self.positions[symbol] = None
-                            self._persist_state()
-                            continue
-                    # If no position, check for new signal
-                    if position is None:
-                        signal, new_state = self.strategy.evaluate_bar(ts, bar, state)
-                        states[symbol] = new_state
-                        if signal:
-                            open_price = next_bar['open']
-                            half_spread = self.config.costs.spread / 2
-                            slip = self.config.costs.slippage
-                            if signal == 'long':
-                                entry_price = open_price + half_spread + slip
-                                sl_price = entry_price * (1.0 - self.config.sl_pct)
-                                tp_price = entry_price * (1.0 + self.config.tp_pct)
-                            else:
-                                entry_price = open_price - half_spread - slip
-                                sl_price = entry_price * (1.0 + self.config.sl_pct)
-                                tp_price = entry_price * (1.0 - self.config.tp_pct)
-                            volume = 0.0  # Determine appropriate volume using account equity via MT5 API
-                            logger.info(
-                                "Placing %s order on %s at %s (SL=%s, TP=%s)",
-                                signal,
-                                symbol,
-                                entry_price,
-                                sl_price,
-                                tp_price,
-                            )
-                            # Record the position (actual order_send call omitted for safety)
-                            self.positions[symbol] = Position(
-                                symbol=symbol,
-                                side=signal,
-                                volume=volume,
-                                entry_price=entry_price,
-                                sl_price=sl_price,
-                                tp_price=tp_price,
-                                entry_time=next_ts,
-                            )
-                            self._persist_state()
-                # Sleep for a minute before polling again
-                time.sleep(60)
+                # Read the wall clock once per cycle and pin it to the
+                # monotonic clock, which then measures the sleep
+                cycle_start = time.monotonic()
+                now = pd.Timestamp.now(tz=self.config.data.timezone)
+                futures = [
+                    self._pool.submit(self._process_symbol, symbol, states)
+                    for symbol in self.config.symbols
+                ]
+                for future in as_completed(futures):
+                    # Re-raise any error from the worker thread
+                    future.result()
+                # Write the state at most once per cycle
+                if self._state_dirty:
+                    self._persist_state()
+                    self._state_dirty = False
+                # Sleep until the next bar is due, net of the time spent above
+                wake_at = cycle_start + self._seconds_until_next_poll(now)
+                time.sleep(max(0.0, wake_at - time.monotonic()))
         except KeyboardInterrupt:
             logger.info("Shutting down MT5 engine...")
         finally:
+            self._pool.shutdown(wait=True)
             self.data_feed.shutdown()
-            self._persist_state()
\ No newline at end of file
+            with self._lock:
+                self._persist_state(pretty=True)
+                self._state_dirty = False
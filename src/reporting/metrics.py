@@ -2,36 +2,126 @@
 Performance metrics calculations.
 
 This module provides helpers to compute common performance statistics
-from a list of trades and an equity curve.  These metrics are used
+from the trades and the equity curve of a run.  These metrics are used
 both for backtesting reports and for monitoring live trading
 performance.
 """
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 import math
 
-from ..execution.models import Trade
+import numpy as np
+
+from ..execution.models import Trade, TradeLog
 from ..execution.backtest_exec import EquityPoint
+from ..utils.jit import njit
+
+
+@njit(cache=True, nogil=True)
+def _reduce_metrics(
+    equity: np.ndarray, pnl: np.ndarray, notional: np.ndarray
+) -> Tuple[float, float, float, float, int, int, float, float, float]:
+    """Reduce the equity curve and trade arrays to raw statistics.
+
+    One pass over `equity` tracks the running peak and the largest
+    drawdown from it; one pass over the trades accumulates every P&L
+    sum together with the mean and variance of the returns
+    ``pnl / notional`` (Welford's update, skipping zero notional).
+
+    Returns
+    -------
+    tuple
+        ``(total_return, max_drawdown, mean_return, return_variance,
+        num_returns, num_wins, gross_profit, gross_loss, total_pnl)``.
+        The variance is the population variance (``ddof=0``).
+    """
+    start = equity[0]
+    total_return = (equity[-1] - start) / start if start != 0.0 else 0.0
+    peak = start
+    max_drawdown = 0.0
+    for i in range(equity.shape[0]):
+        value = equity[i]
+        if value > peak:
+            peak = value
+        if peak != 0.0:
+            drawdown = (peak - value) / peak
+            if drawdown > max_drawdown:
+                max_drawdown = drawdown
 
+    n_ret = 0
+    mean_ret = 0.0
+    m2 = 0.0
+    n_wins = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    sum_pnl = 0.0
+    for i in range(pnl.shape[0]):
+        trade_pnl = pnl[i]
+        sum_pnl += trade_pnl
+        if trade_pnl > 0.0:
+            n_wins += 1
+            gross_profit += trade_pnl
+        elif trade_pnl < 0.0:
+            gross_loss -= trade_pnl
+        if notional[i] != 0.0:
+            ret = trade_pnl / notional[i]
+            n_ret += 1
+            delta = ret - mean_ret
+            mean_ret += delta / n_ret
+            m2 += delta * (ret - mean_ret)
+    var_ret = m2 / n_ret if n_ret > 0 else 0.0
+    return (
+        total_return,
+        max_drawdown,
+        mean_ret,
+        var_ret,
+        n_ret,
+        n_wins,
+        gross_profit,
+        gross_loss,
+        sum_pnl,
+    )
 
-def compute_metrics(trades: List[Trade], equity_curve: List[EquityPoint]) -> dict:
+
+def compute_metrics(
+    trades: Union[TradeLog, List[Trade]],
+    equity_curve: Optional[List[EquityPoint]] = None,
+) -> dict:
     """Compute a set of summary statistics for the backtest.
 
     Parameters
     ----------
-    trades : list of Trade
-        Completed trades containing P&L and fee information.
-    equity_curve : list of EquityPoint
-        Timestamped equity values after each trade.
+    trades : TradeLog or list of Trade
+        Completed trades containing P&L and fee information.  A
+        `TradeLog` is read column‑wise and also provides the equity
+        curve through its ``equity`` column.
+    equity_curve : list of EquityPoint, optional
+        Timestamped equity values after each trade.  Required when
+        `trades` is a list, ignored for a `TradeLog`.
 
     Returns
     -------
     dict
         Dictionary of performance metrics.
     """
-    if not equity_curve:
+    if isinstance(trades, TradeLog):
+        equity = trades.equity
+        pnl = trades.pnl
+        notional = trades.entry_price * trades.volume
+    else:
+        # Gather the inputs into arrays once for the reduction kernel
+        equity_curve = equity_curve or []
+        equity = np.fromiter(
+            (p.equity for p in equity_curve), dtype=np.float64, count=len(equity_curve)
+        )
+        pnl = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=len(trades))
+        notional = np.fromiter(
+            (t.entry_price * t.volume for t in trades), dtype=np.float64, count=len(trades)
+        )
+
+    if equity.size == 0:
         return {
             'total_return': 0.0,
             'max_drawdown': 0.0,
@@ -43,54 +133,39 @@ def compute_metrics(trades: List[Trade], equity_curve: List[EquityPoint]) -> dic
             'num_trades': 0,
         }
 
-    starting_equity = equity_curve[0].equity if equity_curve else 0.0
-    ending_equity = equity_curve[-1].equity
-    total_return = (ending_equity - starting_equity) / starting_equity if starting_equity else 0.0
+    (
+        total_return,
+        max_drawdown,
+        mean_ret,
+        var_ret,
+        n_ret,
+        n_wins,
+        gross_profit,
+        gross_loss,
+        sum_pnl,
+    ) = _reduce_metrics(equity, pnl, notional)
 
-    # Compute drawdown
-    max_equity = starting_equity
-    max_drawdown = 0.0
-    for point in equity_curve:
-        if point.equity > max_equity:
-            max_equity = point.equity
-        drawdown = (max_equity - point.equity) / max_equity if max_equity else 0.0
-        if drawdown > max_drawdown:
-            max_drawdown = drawdown
-
-    # Compute trade returns and Sharpe ratio
-    returns: List[float] = []
-    for trade in trades:
-        notional = trade.entry_price * trade.volume
-        if notional != 0:
-            returns.append(trade.pnl / notional)
-    if returns:
-        mean_ret = sum(returns) / len(returns)
-        variance = sum((r - mean_ret) ** 2 for r in returns) / len(returns)
-        std_dev = math.sqrt(variance)
-        sharpe = (mean_ret / std_dev) * math.sqrt(len(returns)) if std_dev > 0 else 0.0
-    else:
-        sharpe = 0.0
+    # Sharpe ratio of the per-trade returns
+    std_dev = math.sqrt(var_ret)
+    sharpe = (mean_ret / std_dev) * math.sqrt(n_ret) if std_dev > 0 else 0.0
 
     # Win rate and profit factor
-    wins = [t.pnl for t in trades if t.pnl > 0]
-    losses = [t.pnl for t in trades if t.pnl < 0]
-    win_rate = len(wins) / len(trades) if trades else 0.0
-    gross_profit = sum(wins)
-    gross_loss = -sum(losses) if losses else 0.0
+    num_trades = pnl.size
+    win_rate = n_wins / num_trades if num_trades else 0.0
     profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0.0
 
-    avg_trade = sum(t.pnl for t in trades) / len(trades) if trades else 0.0
+    avg_trade = sum_pnl / num_trades if num_trades else 0.0
 
     # Exposure time: not implemented in backtest; set to 0.0 as placeholder
     exposure_time = 0.0
 
     return {
-        'total_return': total_return,
-        'max_drawdown': max_drawdown,
-        'sharpe': sharpe,
-        'win_rate': win_rate,
-        'profit_factor': profit_factor,
-        'avg_trade': avg_trade,
+        'total_return': float(total_return),
+        'max_drawdown': float(max_drawdown),
+        'sharpe': float(sharpe),
+        'win_rate': float(win_rate),
+        'profit_factor': float(profit_factor),
+        'avg_trade': float(avg_trade),
         'exposure_time': exposure_time,
-        'num_trades': len(trades),
-    }
\ No newline at end of file
+        'num_trades': num_trades,
+    }
@@ -10,24 +10,47 @@ future (e.g. HTML reports).
 
 from __future__ import annotations
 
+import csv
 import os
 import json
-from typing import List
-import pandas as pd
-import matplotlib
+from typing import List, Optional, Union
+import numpy as np
 
-# Use non‑interactive backend for environments without display
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-
-from ..execution.models import Trade
+from ..execution.models import REASON_SL, Trade, TradeLog
 from ..execution.backtest_exec import EquityPoint
 from .metrics import compute_metrics
 
 
+# Column header of `trades.csv`
+TRADES_CSV_HEADER = (
+    'timestamp_entry',
+    'timestamp_exit',
+    'symbol',
+    'side',
+    'volume',
+    'entry',
+    'exit',
+    'pnl',
+    'fees',
+    'reason',
+)
+
+
+def _write_summary(out_dir: str, metrics: dict) -> None:
+    """Write the metrics to `summary.json` in `out_dir` as indented JSON.
+
+    Always uses the stdlib encoder: the file is tiny, and orjson would
+    format floats differently and write a NaN metric as ``null``, so its
+    content would depend on which package is installed.
+    """
+    summary_path = os.path.join(out_dir, 'summary.json')
+    with open(summary_path, 'w', encoding='utf-8') as fh:
+        json.dump(metrics, fh, indent=2, ensure_ascii=False)
+
+
 def generate_backtest_report(
-    trades: List[Trade],
-    equity_curve: List[EquityPoint],
+    trades: Union[TradeLog, List[Trade]],
+    equity_curve: Optional[List[EquityPoint]] = None,
     out_dir: str = "results",
 ) -> None:
     """Generate report files for a backtest run.
@@ -38,57 +61,94 @@ def generate_backtest_report(
     - `trades.csv` – detailed list of trades
     - `equity_curve.csv` – account equity after each trade
     - `summary.json` – performance metrics
-    - `equity_curve.png` – line chart of the equity curve
+    - `equity_curve.png` – line chart of the equity curve (only with
+      at least two points; a chart left by an earlier run is removed)
+
+    Without trades the CSVs only hold their header row.
+
+    `trades` is either the `TradeLog` of `BacktestEngine.run_log()`,
+    whose ``exit_time`` and ``equity`` columns form the equity curve, or
+    a list of `Trade` objects together with `equity_curve`, which is
+    then written as given.
     """
     os.makedirs(out_dir, exist_ok=True)
+    if isinstance(trades, TradeLog):
+        trade_log = trades
+        curve_times = trade_log.times('exit_time')
+        curve_equity = trade_log.equity.tolist()
+        curve_iso = [ts.isoformat() for ts in curve_times]
+        trade_rows = zip(
+            (ts.isoformat() for ts in trade_log.times('entry_time')),
+            curve_iso,
+            trade_log.symbol,
+            np.where(trade_log.side > 0, 'long', 'short').tolist(),
+            trade_log.volume.tolist(),
+            trade_log.entry_price.tolist(),
+            trade_log.exit_price.tolist(),
+            trade_log.pnl.tolist(),
+            trade_log.fees.tolist(),
+            np.where(trade_log.reason == REASON_SL, 'sl', 'tp').tolist(),
+        )
+        metrics = compute_metrics(trade_log)
+    else:
+        equity_curve = equity_curve or []
+        curve_times = [pt.timestamp for pt in equity_curve]
+        curve_equity = [pt.equity for pt in equity_curve]
+        curve_iso = [ts.isoformat() for ts in curve_times]
+        trade_rows = (
+            (
+                t.entry_time.isoformat(),
+                t.exit_time.isoformat(),
+                t.symbol,
+                t.side,
+                t.volume,
+                t.entry_price,
+                t.exit_price,
+                t.pnl,
+                t.fees,
+                t.reason,
+            )
+            for t in trades
+        )
+        metrics = compute_metrics(trades, equity_curve)
 
-    # Trades CSV
-    trades_data = [
-        {
-            'timestamp_entry': t.entry_time.isoformat(),
-            'timestamp_exit': t.exit_time.isoformat(),
-            'symbol': t.symbol,
-            'side': t.side,
-            'volume': t.volume,
-            'entry': t.entry_price,
-            'exit': t.exit_price,
-            'pnl': t.pnl,
-            'fees': t.fees,
-            'reason': t.reason,
-        }
-        for t in trades
-    ]
-    df_trades = pd.DataFrame(trades_data)
+    # Trades CSV, streamed row by row
     trades_path = os.path.join(out_dir, 'trades.csv')
-    df_trades.to_csv(trades_path, index=False)
+    with open(trades_path, 'w', encoding='utf-8', newline='') as fh:
+        writer = csv.writer(fh, lineterminator='\n')
+        writer.writerow(TRADES_CSV_HEADER)
+        writer.writerows(trade_rows)
 
     # Equity curve CSV
-    eq_data = [
-        {
-            'timestamp': pt.timestamp.isoformat(),
-            'equity': pt.equity,
-        }
-        for pt in equity_curve
-    ]
-    df_eq = pd.DataFrame(eq_data)
     eq_path = os.path.join(out_dir, 'equity_curve.csv')
-    df_eq.to_csv(eq_path, index=False)
+    with open(eq_path, 'w', encoding='utf-8', newline='') as fh:
+        writer = csv.writer(fh, lineterminator='\n')
+        writer.writerow(('timestamp', 'equity'))
+        writer.writerows(zip(curve_iso, curve_equity))
 
     # Summary JSON
-    metrics = compute_metrics(trades, equity_curve)
-    summary_path = os.path.join(out_dir, 'summary.json')
-    with open(summary_path, 'w', encoding='utf-8') as fh:
-        json.dump(metrics, fh, indent=2, ensure_ascii=False)
+    _write_summary(out_dir, metrics)
+
+    # Equity curve plot; a line needs at least two points
+    plot_path = os.path.join(out_dir, 'equity_curve.png')
+    if len(curve_equity) < 2:
+        # Do not leave the chart of an earlier run next to this summary
+        if os.path.exists(plot_path):
+            os.remove(plot_path)
+        return
+    # matplotlib is slow to import, so load it only when plotting
+    import matplotlib
+
+    # Use non‑interactive backend for environments without display
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
 
-    # Equity curve plot
     fig, ax = plt.subplots(figsize=(10, 4))
-    if not df_eq.empty:
-        ax.plot(pd.to_datetime(df_eq['timestamp']), df_eq['equity'], linewidth=1.5)
-        ax.set_title('Equity Curve')
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Equity')
-        fig.autofmt_xdate()
+    ax.plot(curve_times, curve_equity, linewidth=1.5)
+    ax.set_title('Equity Curve')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Equity')
+    fig.autofmt_xdate()
     fig.tight_layout()
-    plot_path = os.path.join(out_dir, 'equity_curve.png')
     fig.savefig(plot_path)
-    plt.close(fig)
\ No newline at end of file
+    plt.close(fig)
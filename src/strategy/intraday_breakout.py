@@ -11,18 +11,77 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Optional, Tuple
+import numpy as np
 import pandas as pd
 
 from ..config.schema import Config
-from ..utils.timeutils import parse_time_str, is_in_session
+from ..utils.jit import njit
+from ..utils.timeutils import get_timezone, parse_time_str
 
 
-@dataclass
+@dataclass(init=False)
 class IntradayState:
     """Holds intraday high/low levels and last processed date."""
-    high: Optional[float] = None
-    low: Optional[float] = None
-    current_date: Optional[pd.Timestamp.date] = None
+    # Slots need the defaults in __init__ (dataclass(slots=True) needs 3.10+)
+    __slots__ = ('high', 'low', 'current_date')
+    high: Optional[float]
+    low: Optional[float]
+    current_date: Optional[pd.Timestamp.date]
+
+    def __init__(
+        self,
+        high: Optional[float] = None,
+        low: Optional[float] = None,
+        current_date: Optional[pd.Timestamp.date] = None,
+    ) -> None:
+        self.high = high
+        self.low = low
+        self.current_date = current_date
+
+
+@njit(cache=True, nogil=True)
+def breakout_step(
+    high: float,
+    low: float,
+    new_day: bool,
+    cur_high: float,
+    cur_low: float,
+) -> Tuple[int, float, float]:
+    """Evaluate one bar against the intraday levels and update them.
+
+    This is the scalar form of the level tracking in
+    `IntradayBreakoutStrategy.evaluate_bar`, before the session filter,
+    for use inside compiled loops.
+
+    Parameters
+    ----------
+    high, low : float
+        High and low of the bar.
+    new_day : bool
+        Whether the bar is on a different local day than the previously
+        evaluated bar; the first bar of a day only sets the levels.
+    cur_high, cur_low : float
+        Intraday levels from the previously evaluated bars.
+
+    Returns
+    -------
+    signal : int
+        ``1`` when only the high breaks the intraday high, ``-1`` when
+        only the low breaks the intraday low, ``0`` otherwise.
+    cur_high, cur_low : float
+        Updated intraday levels.
+    """
+    if new_day:
+        return 0, high, low
+    long_signal = high > cur_high
+    short_signal = low < cur_low
+    # Branchless: +1 or -1 if only one side breaks, 0 if none or both
+    signal = int(long_signal) - int(short_signal)
+    return (
+        signal,
+        high if long_signal else cur_high,
+        low if short_signal else cur_low,
+    )
 
 
 class IntradayBreakoutStrategy:
@@ -32,6 +91,10 @@ class IntradayBreakoutStrategy:
         self.config = config
         self.session_start = parse_time_str(config.session.start)
         self.session_end = parse_time_str(config.session.end)
+        self._tz = get_timezone(config.data.timezone)
+        # Session bounds as minutes since local midnight (end exclusive)
+        self._start_min = self.session_start.hour * 60 + self.session_start.minute
+        self._end_min = self.session_end.hour * 60 + self.session_end.minute
 
     def evaluate_bar(
         self,
@@ -58,8 +121,10 @@ class IntradayBreakoutStrategy:
         state : IntradayState
             Updated intraday state for subsequent bars.
         """
+        # Convert once; both the day reset and the session check need local time
+        local_ts = ts.tz_convert(self._tz)
         # Reset intraday levels if we are on a new day
-        local_date = ts.tz_convert(self.config.data.timezone).date()
+        local_date = local_ts.date()
         if state.current_date != local_date:
             state.high = None
             state.low = None
@@ -86,7 +151,33 @@ class IntradayBreakoutStrategy:
             state.low = float(bar['low'])
 
         # Only allow trades within the session window
-        if not is_in_session(ts, self.session_start, self.session_end, self.config.data.timezone):
+        minute = local_ts.hour * 60 + local_ts.minute
+        if not self._start_min <= minute < self._end_min:
             signal = None
 
-        return signal, state
\ No newline at end of file
+        return signal, state
+
+    def bar_calendar(self, index: pd.DatetimeIndex) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the local day and session membership of every bar.
+
+        Together with `breakout_step` this lets a compiled loop replay
+        `evaluate_bar` over arrays, on exactly the bars it chooses.
+
+        Parameters
+        ----------
+        index : pandas.DatetimeIndex
+            Timezone‑aware bar timestamps.
+
+        Returns
+        -------
+        days : numpy.ndarray
+            ``int64`` local calendar day of each bar (days since the
+            epoch); the intraday levels reset whenever it changes.
+        in_session : numpy.ndarray
+            ``bool`` mask of the bars inside the session window.
+        """
+        local = index.tz_convert(self._tz)
+        days = local.tz_localize(None).to_numpy().astype('datetime64[D]').view(np.int64)
+        minute = local.hour * 60 + local.minute
+        in_session = np.asarray((minute >= self._start_min) & (minute < self._end_min), dtype=np.bool_)
+        return days, in_session
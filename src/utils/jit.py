@@ -0,0 +1,41 @@
+"""
+Optional Numba JIT support.
+
+The numeric kernels of the backtest are written in the subset of
+Python that Numba can compile.  When the `numba` package is installed
+they are compiled to native code on first use; otherwise `njit` is a
+no‑op decorator and the very same functions run as ordinary Python
+over NumPy arrays.  Users can skip installing Numba at the cost of
+slower backtests.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+# Attempt to import Numba.  If unavailable, kernels run uncompiled.
+try:
+    from numba import njit as _numba_njit  # type: ignore
+except ImportError:
+    _numba_njit = None
+
+# Whether kernels are compiled (and can release the GIL with ``nogil=True``)
+NUMBA_AVAILABLE = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile a function with `numba.njit` if Numba is installed.
+
+    Accepts the same arguments as `numba.njit` and can be used both as
+    ``@njit`` and ``@njit(cache=True)``.  Without Numba the decorated
+    function is returned unchanged.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
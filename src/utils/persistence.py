@@ -5,14 +5,27 @@ Paper and live trading sessions need to remember their state across
 restarts: which positions are currently open and the timestamp of
 the last processed bar.  This module provides simple JSON‑based
 load/save functions for that purpose.
+
+Writes are atomic: the state is written to a temporary file next to
+the target which is then renamed over it, so a crash during the write
+never leaves a truncated or empty state file behind.  When `orjson` is
+installed it is used for (de)serialisation; the on‑disk format stays
+plain JSON either way.
 """
 
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+# Attempt to import orjson.  If unavailable, the stdlib json module is used.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 def load_state(path: str) -> Optional[Dict[str, Any]]:
     """Load a JSON state file.
@@ -30,12 +43,28 @@ def load_state(path: str) -> Optional[Dict[str, Any]]:
     file_path = Path(path)
     if not file_path.exists():
         return None
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
     with file_path.open("r", encoding="utf-8") as fh:
         return json.load(fh)
 
 
-def save_state(path: str, state: Dict[str, Any]) -> None:
-    """Write a JSON state file to disk.
+def _dumps(state: Dict[str, Any], pretty: bool) -> bytes:
+    """Serialise `state` to UTF‑8 JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        return orjson.dumps(state, option=option)
+    if pretty:
+        text = json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True)
+    else:
+        text = json.dumps(state, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def save_state(path: str, state: Dict[str, Any], pretty: bool = False) -> None:
+    """Atomically write a JSON state file to disk.
 
     Parameters
     ----------
@@ -43,8 +72,15 @@ def save_state(path: str, state: Dict[str, Any]) -> None:
         Path to the output file.
     state : dict
         Arbitrary state dictionary.  Must be serialisable to JSON.
+    pretty : bool
+        Indent and sort the keys for a human‑readable file.  Skip this
+        for frequent writes; the compact form is cheaper to produce.
     """
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with file_path.open("w", encoding="utf-8") as fh:
-        json.dump(state, fh, ensure_ascii=False, indent=2, sort_keys=True)
\ No newline at end of file
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(_dumps(state, pretty))
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, file_path)
@@ -9,14 +9,19 @@ trading session.
 
 from __future__ import annotations
 
-from datetime import time
+import functools
+from datetime import time, tzinfo
 from typing import Optional
 import pandas as pd
 
 
+@functools.lru_cache(maxsize=64)
 def parse_time_str(ts: str) -> time:
     """Parse a `HH:MM` string into a `datetime.time` object.
 
+    Results are memoised; `datetime.time` is immutable, so callers can
+    share the returned object.
+
     Parameters
     ----------
     ts : str
@@ -31,6 +36,16 @@ def parse_time_str(ts: str) -> time:
     return time(hour=hour, minute=minute)
 
 
+@functools.lru_cache(maxsize=8)
+def get_timezone(tz_name: str) -> tzinfo:
+    """Resolve an IANA timezone name to the `tzinfo` object pandas uses.
+
+    Results are memoised so that repeated conversions reuse one shared
+    object instead of looking the name up again on every call.
+    """
+    return pd.DatetimeIndex([], tz=tz_name).tz
+
+
 def to_timezone(ts: pd.Timestamp, tz_name: str) -> pd.Timestamp:
     """Convert a `pandas.Timestamp` to the specified timezone.
 
@@ -41,7 +56,7 @@ def to_timezone(ts: pd.Timestamp, tz_name: str) -> pd.Timestamp:
         ts = pd.Timestamp(ts)
     if ts.tzinfo is None:
         ts = ts.tz_localize("UTC")
-    return ts.tz_convert(tz_name)
+    return ts.tz_convert(get_timezone(tz_name))
 
 
 def is_new_day(prev_ts: Optional[pd.Timestamp], current_ts: pd.Timestamp, tz_name: str) -> bool:
@@ -65,6 +80,5 @@ def is_in_session(ts: pd.Timestamp, session_start: time, session_end: time, tz_n
     is exclusive: the bar whose close time equals the session end is
     considered outside the session.
     """
-    local_ts = to_timezone(ts, tz_name)
-    current_time = local_ts.timetz()
+    current_time = to_timezone(ts, tz_name).timetz()
     return (session_start <= current_time < session_end)
\ No newline at end of file
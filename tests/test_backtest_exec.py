@@ -0,0 +1,180 @@
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.config.schema import Config
+from src.execution.backtest_exec import BacktestEngine
+from src.strategy.intraday_breakout import IntradayBreakoutStrategy, IntradayState
+
+import unittest
+
+
+# Hourly bars of one day in Europe/Brussels, within the default session.
+# Levels start at the 08:00 bar; with 1 % SL/TP and no costs:
+# - 09:00 breaks the high -> long at the 10:00 open (100), SL 99 / TP 101
+# - bars with an open position (10:00, 13:00) do not move the levels
+# - 11:00 touches both SL and TP -> stopped out at 99; it breaks both
+#   levels, so it gives no signal
+# - 12:00 breaks the low -> short at the 13:00 open (98), TP 97.02
+# - 14:00 reaches TP and breaks the low again -> short re-entered from
+#   the exit bar at the 15:00 open (97), SL 97.97
+# - only the last bar (17:00) would stop that short out, but the last
+#   bar is never scanned, so the position is still open and dropped
+BARS = """time,open,high,low,close
+2024-01-08 08:00:00,100.0,100.0,99.8,100.0
+2024-01-08 09:00:00,100.0,100.2,99.9,100.1
+2024-01-08 10:00:00,100.0,100.5,99.9,100.0
+2024-01-08 11:00:00,100.0,101.5,98.5,99.0
+2024-01-08 12:00:00,99.0,99.0,98.0,98.5
+2024-01-08 13:00:00,98.0,98.2,97.9,98.0
+2024-01-08 14:00:00,98.0,98.1,97.0,97.5
+2024-01-08 15:00:00,97.0,97.1,96.95,97.0
+2024-01-08 16:00:00,97.0,97.2,96.9,97.0
+2024-01-08 17:00:00,97.0,98.5,96.9,98.0
+"""
+
+
+def reference_trades(engine: BacktestEngine, symbol: str) -> list:
+    """Replay `symbol` bar by bar, calling `evaluate_bar` only while flat."""
+    config = engine.config
+    costs = config.costs
+    strategy = IntradayBreakoutStrategy(config)
+    df = engine.data_loader.load(symbol)
+    state = IntradayState()
+    position = None
+    equity = engine.initial_equity
+    trades = []
+    for idx in range(len(df) - 1):
+        ts = df.index[idx]
+        bar = df.iloc[idx]
+        if position is not None:
+            side, entry_time, entry, sl_price, tp_price, volume = position
+            direction = 1.0 if side == 'long' else -1.0
+            if side == 'long':
+                hit_sl, hit_tp = bar['low'] <= sl_price, bar['high'] >= tp_price
+            else:
+                hit_sl, hit_tp = bar['high'] >= sl_price, bar['low'] <= tp_price
+            if hit_sl or hit_tp:
+                base = sl_price if hit_sl else tp_price
+                exit_price = base - direction * (costs.spread / 2 + costs.slippage)
+                pnl = direction * (exit_price - entry) * volume
+                equity += pnl - costs.commission_per_lot * volume
+                trades.append((side, entry_time, ts, entry, exit_price, pnl, equity))
+                position = None
+        if position is None:
+            signal, state = strategy.evaluate_bar(ts, bar, state)
+            if signal:
+                direction = 1.0 if signal == 'long' else -1.0
+                open_price = float(df['open'].iloc[idx + 1])
+                entry = open_price + direction * (costs.spread / 2 + costs.slippage)
+                sl_price = entry * (1.0 - direction * config.sl_pct)
+                tp_price = entry * (1.0 + direction * config.tp_pct)
+                volume = equity * config.equity_pct_per_trade / open_price
+                position = (signal, df.index[idx + 1], entry, sl_price, tp_price, volume)
+    return trades
+
+
+class TestBacktestEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for symbol in ("AAA", "BBB"):
+            with open(os.path.join(tmp.name, f"{symbol}.csv"), "w", encoding="utf-8") as fh:
+                fh.write(BARS)
+        self.cfg = Config(symbols=["AAA"], timeframe="H1")
+        self.cfg.data.csv_dir = tmp.name
+        self.cfg.sl_pct = 0.01
+        self.cfg.tp_pct = 0.01
+
+    def test_trade_sequence(self) -> None:
+        log = BacktestEngine(self.cfg, max_workers=1).run_log()
+        self.assertEqual(len(log), 2)
+        frame = log.to_frame()
+        tz = "Europe/Brussels"
+
+        # SL takes precedence when a bar touches both levels
+        first = frame.iloc[0]
+        self.assertEqual(first['side'], 'long')
+        self.assertEqual(first['reason'], 'sl')
+        self.assertEqual(first['entry_time'], pd.Timestamp("2024-01-08 10:00", tz=tz))
+        self.assertEqual(first['exit_time'], pd.Timestamp("2024-01-08 11:00", tz=tz))
+        self.assertAlmostEqual(first['entry_price'], 100.0)
+        self.assertAlmostEqual(first['exit_price'], 99.0)
+        volume = 100_000.0 * 0.02 / 100.0
+        self.assertAlmostEqual(first['volume'], volume)
+        self.assertAlmostEqual(first['pnl'], -1.0 * volume)
+        equity = 100_000.0 - volume
+
+        second = frame.iloc[1]
+        self.assertEqual(second['side'], 'short')
+        self.assertEqual(second['reason'], 'tp')
+        self.assertEqual(second['entry_time'], pd.Timestamp("2024-01-08 13:00", tz=tz))
+        self.assertEqual(second['exit_time'], pd.Timestamp("2024-01-08 14:00", tz=tz))
+        volume = equity * 0.02 / 98.0
+        self.assertAlmostEqual(second['exit_price'], 98.0 * 0.99)
+        self.assertAlmostEqual(second['pnl'], (98.0 - 98.0 * 0.99) * volume)
+        self.assertAlmostEqual(second['equity'], equity + (98.0 - 98.0 * 0.99) * volume)
+
+        # The short re-entered from the exit bar at 15:00 is still open
+        # when the data ends (the 17:00 bar would stop it out) and dropped
+        self.assertFalse((frame['entry_time'] == pd.Timestamp("2024-01-08 15:00", tz=tz)).any())
+
+    def test_matches_reference_loop(self) -> None:
+        # Hourly random walk across the spring DST change with offset timestamps
+        rng = np.random.default_rng(7)
+        index = pd.date_range("2024-03-18", periods=24 * 21, freq="h", tz="Europe/Brussels")
+        close = 1.1 * np.exp(np.cumsum(rng.normal(0.0, 0.001, len(index))))
+        spread = np.abs(rng.normal(0.0, 0.0008, (2, len(index))))
+        bars = pd.DataFrame({
+            "time": index.strftime("%Y-%m-%d %H:%M:%S%z"),
+            "open": np.roll(close, 1),
+            "high": np.maximum(close, np.roll(close, 1)) + spread[0],
+            "low": np.minimum(close, np.roll(close, 1)) - spread[1],
+            "close": close,
+        })
+        bars.to_csv(os.path.join(self.cfg.data.csv_dir, "RND.csv"), index=False)
+        self.cfg.symbols = ["RND"]
+        self.cfg.sl_pct = 0.002
+        self.cfg.tp_pct = 0.003
+        self.cfg.costs.spread = 0.0002
+        self.cfg.costs.slippage = 0.00005
+        self.cfg.costs.commission_per_lot = 0.00001
+
+        engine = BacktestEngine(self.cfg, max_workers=1)
+        frame = engine.run_log().to_frame()
+        expected = reference_trades(engine, "RND")
+        self.assertGreater(len(expected), 20)
+        self.assertEqual(len(frame), len(expected))
+        for row, trade in zip(frame.itertuples(), expected):
+            side, entry_time, exit_time, entry, exit_price, pnl, equity = trade
+            self.assertEqual((row.side, row.entry_time, row.exit_time), (side, entry_time, exit_time))
+            self.assertAlmostEqual(row.entry_price, entry)
+            self.assertAlmostEqual(row.exit_price, exit_price)
+            self.assertAlmostEqual(row.pnl, pnl)
+            self.assertAlmostEqual(row.equity, equity)
+
+    def test_parallel_run_matches_serial_chain(self) -> None:
+        self.cfg.symbols = ["AAA", "BBB"]
+        serial = BacktestEngine(self.cfg, max_workers=1).run_log()
+        parallel = BacktestEngine(self.cfg, max_workers=2).run_log()
+        self.assertEqual(len(serial), 4)
+        for name, column in serial.columns().items():
+            np.testing.assert_array_equal(getattr(parallel, name), column, err_msg=name)
+
+        # BBB has the same bars, so its trades are AAA's scaled to the
+        # equity AAA finished with
+        factor = serial.equity[1] / 100_000.0
+        np.testing.assert_allclose(serial.pnl[2:], serial.pnl[:2] * factor)
+        np.testing.assert_allclose(serial.equity[2:], serial.equity[:2] * factor)
+
+
+if __name__ == '__main__':
+    unittest.main()
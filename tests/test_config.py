@@ -0,0 +1,91 @@
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from unittest import mock
+
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.config import schema
+from src.config.schema import load_config
+
+import unittest
+
+
+class TestLoadConfig(unittest.TestCase):
+    def _write(self, text: str) -> str:
+        fd, path = tempfile.mkstemp(suffix=".yaml")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_defaults_and_coercion(self) -> None:
+        cfg = load_config(self._write("symbols: [GBPUSD]\ncosts:\n  spread: 1\nsession:\n"))
+        self.assertEqual(cfg.symbols, ["GBPUSD"])
+        # Integers are converted to the annotated float type
+        self.assertIsInstance(cfg.costs.spread, float)
+        self.assertEqual(cfg.costs.spread, 1.0)
+        # Missing and empty sections fall back to defaults
+        self.assertEqual(cfg.costs.slippage, 0.0)
+        self.assertEqual(cfg.session.start, "06:00")
+        self.assertEqual(cfg.data.timezone, "Europe/Brussels")
+
+    def test_blank_values_keep_defaults(self) -> None:
+        cfg = load_config(self._write("mt5:\n  login:\n  password:\n  path:\n"))
+        self.assertEqual(cfg.mt5.login, 0)
+        self.assertEqual(cfg.mt5.password, "")
+        self.assertEqual(cfg.mt5.path, "")
+        cfg = load_config(self._write("sl_pct:\ntp_pct:\nequity_pct_per_trade:\ntimeframe:\nmode:\n"))
+        self.assertEqual((cfg.sl_pct, cfg.tp_pct, cfg.equity_pct_per_trade), (0.005, 0.005, 0.02))
+        self.assertEqual((cfg.timeframe, cfg.mode), ("H1", "backtest"))
+
+    def test_invalid_scalars_rejected(self) -> None:
+        cases = [
+            ("timeframe: [1]\n", "'timeframe'"),
+            ("mode: {}\n", "'mode'"),
+            ("sl_pct: true\n", "'sl_pct'"),
+            ("session:\n  start: 6\n", "'session.start'"),
+            # Unquoted, YAML reads 20:00 as the base-60 integer 1200
+            ("session:\n  end: 20:00\n", "'session.end'"),
+            ("session:\n  end: '24:00'\n", "'session.end'"),
+        ]
+        for text, key in cases:
+            with self.subTest(text=text), self.assertRaises(ValueError) as ctx:
+                load_config(self._write(text))
+            self.assertIn(key, str(ctx.exception))
+
+    def test_non_integral_int_rejected(self) -> None:
+        self.assertEqual(load_config(self._write("mt5:\n  login: 12345.0\n")).mt5.login, 12345)
+        with self.assertRaises(ValueError):
+            load_config(self._write("mt5:\n  login: 12345.9\n"))
+
+    def test_unsupported_annotation(self) -> None:
+        @dataclass
+        class Section:
+            flag: bool = False
+
+        with mock.patch.dict(schema._DEFAULTS, {'extra': {'flag': False}}):
+            with self.assertRaises(TypeError) as ctx:
+                schema._section({'extra': {'flag': True}}, 'extra', Section)
+        self.assertIn("extra.flag", str(ctx.exception))
+
+    def test_malformed_structure_rejected(self) -> None:
+        cases = ("symbols:\n", "- EURUSD\n- GBPUSD\n", 'session: "06:00"\n', "symbols: EURUSD\n",
+                 "sl_pct: [0.01]\n", "tp_pct: {}\n")
+        for text in cases:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                load_config(self._write(text))
+        # A blank top-level value is not a TypeError but keeps its default
+        self.assertEqual(load_config(self._write("sl_pct:\n")).sl_pct, 0.005)
+
+    def test_unknown_key_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            load_config(self._write("costs:\n  sprad: 0.0002\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import sys
+import tempfile
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.data import csv_data
+from src.data.csv_data import CSVDataLoader
+
+import unittest
+
+
+class TestCSVDataLoader(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv_dir = tmp.name
+
+    def _write(self, symbol: str, text: str) -> str:
+        path = os.path.join(self.csv_dir, f"{symbol}.csv")
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        return path
+
+    def test_offsets_across_dst(self) -> None:
+        # A local-time export switches from +01:00 to +02:00 overnight
+        self._write(
+            "TEST",
+            "time,open,high,low,close\n"
+            "2024-03-31T00:00:00+01:00,1.0,1.1,0.9,1.0\n"
+            "2024-03-31T01:00:00+01:00,1.0,1.1,0.9,1.0\n"
+            "2024-03-31T03:00:00+02:00,1.0,1.1,0.9,1.0\n",
+        )
+        df = CSVDataLoader(self.csv_dir, "Europe/Brussels").load("TEST")
+        self.assertEqual(str(df.index.tz), "Europe/Brussels")
+        expected = pd.date_range("2024-03-30 23:00", periods=3, freq="h", tz="UTC")
+        self.assertTrue((df.index == expected).all())
+
+    def test_naive_times_are_local(self) -> None:
+        self._write(
+            "TEST",
+            "time,open,high,low,close\n"
+            "2024-01-08 08:00:00,1.0,1.1,0.9,1.0\n"
+            "2024-01-08 09:00:00,1.0,1.1,0.9,1.0\n",
+        )
+        df = CSVDataLoader(self.csv_dir, "Europe/Brussels").load("TEST")
+        self.assertEqual(df.index[0], pd.Timestamp("2024-01-08 08:00", tz="Europe/Brussels"))
+        self.assertEqual(str(df["open"].dtype), "float32")
+
+    def test_mt5_export(self) -> None:
+        # Tab-separated terminal export in broker local time, rows out of order
+        self._write(
+            "TEST",
+            "<DATE>\t<TIME>\t<OPEN>\t<HIGH>\t<LOW>\t<CLOSE>\t<TICKVOL>\t<VOL>\t<SPREAD>\n"
+            "2024.03.31\t03:00:00\t1.08120\t1.08200\t1.08050\t1.08150\t812\t0\t7\n"
+            "2024.03.31\t01:00:00\t1.08000\t1.08100\t1.07900\t1.08050\t530\t0\t8\n",
+        )
+        loader = CSVDataLoader(self.csv_dir, "Europe/Brussels")
+        df = loader.load("TEST")
+        self.assertEqual(list(df.columns), ["open", "high", "low", "close"])
+        self.assertTrue(all(str(dtype) == "float32" for dtype in df.dtypes))
+        # Localised in the configured timezone, across the DST change
+        expected = pd.DatetimeIndex(["2024-03-31 01:00", "2024-03-31 03:00"]).tz_localize("Europe/Brussels")
+        self.assertTrue((df.index == expected).all())
+        self.assertEqual(str(df.index.tz), "Europe/Brussels")
+        self.assertEqual(df["open"].tolist(), [np.float32(1.08), np.float32(1.0812)])
+        self.assertEqual(df["low"].iloc[1], np.float32(1.0805))
+        closes = loader.price_arrays("TEST")[3]
+        self.assertEqual(closes.tolist(), df["close"].tolist())
+
+    def test_missing_columns_rejected(self) -> None:
+        self._write("TEST", "time,open,high,close\n2024-01-08 08:00:00,1.0,1.1,1.0\n")
+        with self.assertRaisesRegex(ValueError, r"Missing columns: \['low'\]"):
+            CSVDataLoader(self.csv_dir, "Europe/Brussels").load("TEST")
+
+    @unittest.skipIf(csv_data.pyarrow is None, "pyarrow is not installed")
+    def test_parquet_cache(self) -> None:
+        header = "time,open,high,low,close\n"
+        path = self._write("TEST", header + "2024-01-08 08:00:00,1.0,1.1,0.9,1.0\n")
+        cache_path = os.path.join(self.csv_dir, ".cache", "TEST.parquet")
+
+        # Miss: the CSV is parsed and the cache written
+        loader = CSVDataLoader(self.csv_dir, "Europe/Brussels")
+        first = loader.load("TEST")
+        self.assertTrue(os.path.exists(cache_path))
+
+        # Hit: a fresh loader reads the cache without parsing
+        loader = CSVDataLoader(self.csv_dir, "Europe/Brussels")
+        with mock.patch.object(loader, "_parse", side_effect=AssertionError("parsed")):
+            cached = loader.load("TEST")
+        pd.testing.assert_frame_equal(cached, first)
+
+        # Invalidation: replaced by a file with an older mtime (cp -p, rsync -t)
+        st = os.stat(path)
+        self._write("TEST", header + "2024-01-08 08:00:00,2.0,2.1,1.9,2.0\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+        replaced = CSVDataLoader(self.csv_dir, "Europe/Brussels").load("TEST")
+        self.assertEqual(float(replaced["open"].iloc[0]), 2.0)
+        self.assertEqual(os.listdir(os.path.dirname(cache_path)), ["TEST.parquet"])
+
+    @unittest.skipIf(csv_data.pyarrow is None, "pyarrow is not installed")
+    def test_failed_cache_write_leaves_no_temp_file(self) -> None:
+        self._write("TEST", "time,open,high,low,close\n2024-01-08 08:00:00,1.0,1.1,0.9,1.0\n")
+        with mock.patch.object(csv_data.pq, "write_table", side_effect=OSError("disk full")), \
+                self.assertLogs(csv_data.logger, "WARNING"):
+            df = CSVDataLoader(self.csv_dir, "Europe/Brussels").load("TEST")
+        self.assertEqual(len(df), 1)
+        self.assertEqual(os.listdir(os.path.join(self.csv_dir, ".cache")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import math
+import os
+import sys
+
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.execution.backtest_exec import EquityPoint
+from src.execution.models import REASON_SL, SIDE_LONG, SIDE_SHORT, Trade, TradeLog
+from src.reporting.metrics import compute_metrics
+
+import unittest
+
+
+class TestMetrics(unittest.TestCase):
+    def test_compute_metrics(self) -> None:
+        ts = pd.Timestamp("2024-01-02 10:00", tz="UTC")
+
+        def trade(pnl: float, volume: float = 1000.0) -> Trade:
+            return Trade("TEST", "long", volume, 1.0, 1.0, ts, ts, pnl, 0.0, "tp")
+
+        # A zero-volume trade counts for the P&L stats but not the Sharpe ratio
+        trades = [trade(20.0), trade(-10.0), trade(10.0), trade(-5.0, volume=0.0)]
+        equity = [EquityPoint(ts, value) for value in (100.0, 120.0, 90.0, 100.0, 95.0)]
+        metrics = compute_metrics(trades, equity)
+
+        self.assertAlmostEqual(metrics['total_return'], -0.05)
+        self.assertAlmostEqual(metrics['max_drawdown'], 0.25)
+        returns = [0.02, -0.01, 0.01]
+        mean = sum(returns) / 3
+        std = math.sqrt(sum((r - mean) ** 2 for r in returns) / 3)
+        self.assertAlmostEqual(metrics['sharpe'], mean / std * math.sqrt(3))
+        self.assertEqual(metrics['win_rate'], 0.5)
+        self.assertAlmostEqual(metrics['profit_factor'], 2.0)
+        self.assertAlmostEqual(metrics['avg_trade'], 3.75)
+        self.assertEqual(metrics['num_trades'], 4)
+
+    def test_trade_log_matches_lists(self) -> None:
+        ts = pd.Timestamp("2024-03-30 10:00", tz="Europe/Brussels")
+        trades = [
+            Trade("TEST", "long" if i % 2 else "short", 1000.0, 1.0, 1.0, ts, ts, pnl, 0.0, "sl")
+            for i, pnl in enumerate([5.0, -3.0, 2.0, -1.0, 4.0] * 10)
+        ]
+        equity = [EquityPoint(ts, 100.0 + i) for i in range(len(trades))]
+        # Extending past the initial capacity has to grow the buffers
+        log = TradeLog("Europe/Brussels", capacity=4)
+        for start in range(0, len(trades), 5):
+            chunk = trades[start:start + 5]
+            log.extend(
+                symbol="TEST",
+                side=[SIDE_LONG if t.side == "long" else SIDE_SHORT for t in chunk],
+                volume=[t.volume for t in chunk],
+                entry_price=[t.entry_price for t in chunk],
+                exit_price=[t.exit_price for t in chunk],
+                entry_time=pd.DatetimeIndex([t.entry_time for t in chunk]),
+                exit_time=pd.DatetimeIndex([t.exit_time for t in chunk]),
+                pnl=[t.pnl for t in chunk],
+                fees=[t.fees for t in chunk],
+                reason=REASON_SL,
+                equity=[point.equity for point in equity[start:start + 5]],
+            )
+        self.assertEqual(len(log), 50)
+        self.assertEqual(log.to_frame()['entry_time'].iloc[0], ts)
+        self.assertEqual(compute_metrics(log), compute_metrics(trades, equity))
+
+    def test_empty_inputs(self) -> None:
+        metrics = compute_metrics([], [])
+        self.assertEqual(metrics['num_trades'], 0)
+        self.assertEqual(metrics['max_drawdown'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import datetime
+import os
+import sys
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.config.schema import Config
+from src.execution import mt5_exec
+from src.execution.models import Position
+from src.strategy.intraday_breakout import IntradayState
+
+import unittest
+
+
+TZ = "Europe/Brussels"
+
+
+class FakeFeed:
+    """Stands in for `MT5DataFeed`, serving fixed bars per symbol."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.calls = 0
+
+    def connect(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+    def get_latest_rates(self, symbol, n=3):
+        self.calls += 1
+        return self.bars[symbol]
+
+
+def make_bars(start: str, rows) -> pd.DataFrame:
+    index = pd.date_range(start, periods=len(rows), freq="h", tz=TZ)
+    return pd.DataFrame(rows, columns=["open", "high", "low", "close"], index=index)
+
+
+class TestMT5Engine(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state_file = os.path.join(tmp.name, "state.json")
+        self.cfg = Config(symbols=["A"], timeframe="H1")
+        self.cfg.sl_pct = 0.01
+        self.cfg.tp_pct = 0.01
+
+    def _engine(self) -> mt5_exec.MT5Engine:
+        engine = mt5_exec.MT5Engine(self.cfg, state_file=self.state_file)
+        self.addCleanup(engine._pool.shutdown)
+        return engine
+
+    def test_poll_schedule(self) -> None:
+        engine = self._engine()
+        engine.last_bar_times["A"] = pd.Timestamp("2024-05-01 09:00", tz=TZ)
+        # Latest closed bar already seen: wait for the next close plus the delay
+        now = pd.Timestamp("2024-05-01 10:59:30", tz=TZ)
+        self.assertEqual(engine._seconds_until_next_poll(now), 32.0)
+        # The 10:00 bar is due but missing: retry shortly after the close ...
+        now = pd.Timestamp("2024-05-01 11:00:10", tz=TZ)
+        self.assertEqual(engine._seconds_until_next_poll(now), mt5_exec._BAR_RETRY_S)
+        # ... but only within the retry window (the same instant given in UTC)
+        now = pd.Timestamp("2024-05-01 09:01:30", tz="UTC")
+        self.assertEqual(engine._seconds_until_next_poll(now), 60 * 58.5 + 2.0)
+
+        self.cfg.timeframe = "W1"
+        self.assertEqual(engine._seconds_until_next_poll(now), 60.0)
+
+    def test_process_symbol_entry_and_dedup(self) -> None:
+        engine = self._engine()
+        # The 11:00 bar breaks the intraday high; 12:00 is still forming
+        bars = make_bars("2024-01-08 10:00", [
+            (1.095, 1.099, 1.091, 1.095),
+            (1.098, 1.105, 1.095, 1.102),
+            (1.102, 1.103, 1.101, 1.102),
+        ])
+        engine.data_feed = FakeFeed({"A": bars})
+        states = {"A": IntradayState(1.100, 1.090, datetime.date(2024, 1, 8))}
+
+        engine._process_symbol("A", states)
+        position = engine.positions["A"]
+        self.assertEqual(position.side, "long")
+        self.assertEqual(position.entry_price, 1.102)
+        self.assertAlmostEqual(position.sl_price, 1.102 * 0.99)
+        self.assertEqual(position.entry_time, bars.index[-1])
+        self.assertEqual(engine.last_bar_times["A"], bars.index[-2])
+        # Only marked dirty; the poll loop writes the state once per cycle
+        self.assertTrue(engine._state_dirty)
+        self.assertFalse(os.path.exists(self.state_file))
+
+        # The same closed bar is not evaluated again on the next poll
+        engine.positions["A"] = None
+        with mock.patch.object(engine.strategy, "evaluate_bar", side_effect=AssertionError):
+            engine._process_symbol("A", states)
+        self.assertEqual(engine.data_feed.calls, 2)
+        self.assertIsNone(engine.positions["A"])
+
+    def test_exits_flushed_once_per_cycle(self) -> None:
+        self.cfg.symbols = ["A", "B"]
+        engine = self._engine()
+        # Both positions are stopped out by the closed 11:00 bar
+        bars = make_bars("2024-01-08 10:00", [
+            (1.10, 1.10, 1.10, 1.10),
+            (1.10, 1.10, 1.08, 1.09),
+            (1.09, 1.09, 1.09, 1.09),
+        ])
+        engine.data_feed = FakeFeed({"A": bars, "B": bars})
+        entry_time = pd.Timestamp("2024-01-08 09:00", tz=TZ)
+        for symbol in self.cfg.symbols:
+            engine.positions[symbol] = Position(symbol, "long", 0.0, 1.10, 1.089, 1.111, entry_time)
+
+        with mock.patch.object(mt5_exec, "save_state", wraps=mt5_exec.save_state) as save, \
+                mock.patch.object(mt5_exec.time, "sleep", side_effect=KeyboardInterrupt):
+            engine.run()
+        self.assertEqual(engine.positions, {"A": None, "B": None})
+        # One write for the cycle with two exits, then the shutdown snapshot
+        self.assertEqual([call.kwargs["pretty"] for call in save.call_args_list], [False, True])
+
+    def test_restart_restores_positions(self) -> None:
+        engine = self._engine()
+        entry_time = pd.Timestamp("2024-03-31 03:00", tz=TZ)
+        engine.positions["A"] = Position("A", "short", 0.0, 1.08, 1.09, 1.07, entry_time)
+        engine._persist_state()
+
+        restored = self._engine().positions["A"]
+        self.assertEqual(restored, engine.positions["A"])
+        self.assertEqual(str(restored.entry_time.tz), TZ)
+
+
+if __name__ == '__main__':
+    unittest.main()
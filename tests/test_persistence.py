@@ -0,0 +1,29 @@
+import os
+import sys
+import tempfile
+
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.utils.persistence import load_state, save_state
+
+import unittest
+
+
+class TestPersistence(unittest.TestCase):
+    def test_round_trip_replaces_atomically(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "state.json")
+            self.assertIsNone(load_state(path))
+            state = {"positions": {"EURUSD": None, "GBPUSD": {"side": "long", "entry_price": 1.25}}}
+            save_state(path, state)
+            # Overwriting goes through a temporary file that is renamed away
+            save_state(path, state, pretty=True)
+            self.assertEqual(load_state(path), state)
+            self.assertEqual(os.listdir(tmp_dir), ["state.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
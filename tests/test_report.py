@@ -0,0 +1,54 @@
+import csv
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.execution.backtest_exec import EquityPoint
+from src.reporting.report import TRADES_CSV_HEADER, generate_backtest_report
+
+import unittest
+
+
+class TestBacktestReport(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out_dir = tmp.name
+
+    def _rows(self, name: str) -> list:
+        with open(os.path.join(self.out_dir, name), newline='', encoding='utf-8') as fh:
+            return list(csv.reader(fh))
+
+    def test_list_equity_curve_written_as_given(self) -> None:
+        # No trades, but a curve whose points are not tied to trade exits
+        times = pd.date_range("2024-01-08 08:00", periods=3, freq="h", tz="Europe/Brussels")
+        equity = [100.0, 101.5, 99.0]
+        curve = [EquityPoint(ts, eq) for ts, eq in zip(times, equity)]
+        generate_backtest_report([], curve, out_dir=self.out_dir)
+
+        self.assertEqual(self._rows('trades.csv'), [list(TRADES_CSV_HEADER)])
+        expected = [[ts.isoformat(), repr(eq)] for ts, eq in zip(times, equity)]
+        self.assertEqual(self._rows('equity_curve.csv'), [['timestamp', 'equity']] + expected)
+        self.assertTrue(os.path.exists(os.path.join(self.out_dir, 'equity_curve.png')))
+
+
+    def test_no_trades_replaces_previous_artefacts(self) -> None:
+        times = pd.date_range("2024-01-08 08:00", periods=2, freq="h", tz="UTC")
+        generate_backtest_report([], [EquityPoint(ts, 100.0) for ts in times], out_dir=self.out_dir)
+        self.assertTrue(os.path.exists(os.path.join(self.out_dir, 'equity_curve.png')))
+
+        generate_backtest_report([], [], out_dir=self.out_dir)
+        self.assertEqual(self._rows('trades.csv'), [list(TRADES_CSV_HEADER)])
+        self.assertEqual(self._rows('equity_curve.csv'), [['timestamp', 'equity']])
+        self.assertFalse(os.path.exists(os.path.join(self.out_dir, 'equity_curve.png')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+CURRENT_DIR = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, os.pardir))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.config.schema import Config
+from src.strategy.intraday_breakout import IntradayBreakoutStrategy, IntradayState, breakout_step
+
+import unittest
+
+
+class TestVectorizedSignals(unittest.TestCase):
+    def test_step_matches_evaluate_bar(self) -> None:
+        cfg = Config(symbols=["TEST"], timeframe="H1")
+        strategy = IntradayBreakoutStrategy(cfg)
+        # Hourly random walk spanning the spring DST change, indexed in UTC
+        rng = np.random.default_rng(42)
+        index = pd.date_range("2024-03-25", periods=24 * 10, freq="h", tz="UTC")
+        close = 1.1 + np.cumsum(rng.normal(0.0, 0.001, len(index)))
+        bars = pd.DataFrame(
+            {
+                "open": close,
+                "high": close + np.abs(rng.normal(0.0, 0.001, len(index))),
+                "low": close - np.abs(rng.normal(0.0, 0.001, len(index))),
+                "close": close,
+            },
+            index=index,
+        )
+
+        expected = []
+        state = IntradayState()
+        codes = {"long": 1, "short": -1, None: 0}
+        for ts, bar in bars.iterrows():
+            signal, state = strategy.evaluate_bar(ts, bar, state)
+            expected.append(codes[signal])
+
+        # Replay every bar through the array form with one running state
+        days, in_session = strategy.bar_calendar(bars.index)
+        signals = []
+        cur_day, cur_high, cur_low = None, 0.0, 0.0
+        for high, low, day, active in zip(bars["high"], bars["low"], days, in_session):
+            signal, cur_high, cur_low = breakout_step(high, low, day != cur_day, cur_high, cur_low)
+            cur_day = day
+            signals.append(signal if active else 0)
+        self.assertEqual(signals, expected)
+        self.assertTrue(1 in signals and -1 in signals)
+
+if __name__ == '__main__':
+    unittest.main()